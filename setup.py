@@ -24,7 +24,7 @@ extras_require = {
     "sqlite": ["sqlalchemy>=2.0.0"],
 
     # Compression algorithms
-    "compression": ["zstandard>=0.21.0", "lz4>=4.3.0"],
+    "compression": ["zstandard>=0.21.0", "lz4>=4.3.0", "msgpack>=1.0.0"],
 
     # Framework integrations
     "django": ["django>=3.2"],
@@ -34,6 +34,9 @@ extras_require = {
     # Async support
     "async": ["aiofiles>=23.0.0"],
 
+    # Faster JSON serialization
+    "speedups": ["orjson>=3.9.0", "blake3>=0.3.0"],
+
     # Development dependencies
     "dev": [
         "pytest>=7.4.0",
@@ -65,7 +68,8 @@ extras_require["all"] = list(set(
     extras_require["django"] +
     extras_require["flask"] +
     extras_require["fastapi"] +
-    extras_require["async"]
+    extras_require["async"] +
+    extras_require["speedups"]
 ))
 
 setup(
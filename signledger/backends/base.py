@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, List, Iterator, Dict, Any
 import json
 
-from ..core.exceptions import StorageError
+from ..core.exceptions import StorageError, PartialWriteError
 
 
 class StorageBackend(ABC):
@@ -27,6 +27,33 @@ class StorageBackend(ABC):
         """
         pass
     
+    def append_entries(self, entries: List[Any]) -> None:
+        """Append several entries in order.
+        
+        Backends that can write a batch in one round trip should override
+        this; the default appends entries one at a time. Overrides should
+        store all entries or none, or raise ``PartialWriteError``.
+        
+        Args:
+            entries: Entries to append, oldest first
+            
+        Raises:
+            PartialWriteError: If append fails after storing some entries
+            StorageError: If append fails
+        """
+        for stored_count, entry in enumerate(entries):
+            try:
+                self.append_entry(entry)
+            except Exception as e:
+                if not stored_count:
+                    raise
+                raise PartialWriteError(
+                    f"Failed to append entry {stored_count + 1} of {len(entries)}: {e}",
+                    "append",
+                    self.name,
+                    stored_count,
+                )
+    
     @abstractmethod
     def get_entry(self, entry_id: str) -> Optional[Any]:
         """Get entry by ID.
@@ -3,7 +3,7 @@
 import sqlite3
 import json
 from datetime import datetime
-from typing import Optional, Iterator, Dict, Any
+from typing import Optional, Iterator, Dict, Any, List
 from pathlib import Path
 import logging
 import threading
@@ -96,6 +96,20 @@ class SQLiteBackend(StorageBackend):
         
         conn.commit()
     
+    @staticmethod
+    def _entry_params(entry: Entry) -> tuple:
+        """Build INSERT parameters for an entry."""
+        return (
+            entry.id,
+            entry.timestamp.isoformat(),
+            json.dumps(entry.data),
+            entry.hash,
+            entry.previous_hash,
+            entry.signature,
+            json.dumps(entry.metadata) if entry.metadata else None,
+            entry.nonce,
+        )
+    
     def append_entry(self, entry: Entry) -> None:
         """Append entry to the ledger."""
         conn = self._get_connection()
@@ -105,16 +119,7 @@ class SQLiteBackend(StorageBackend):
                 INSERT INTO {self.table_name} 
                 (id, timestamp, data, hash, previous_hash, signature, metadata, nonce)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry.id,
-                entry.timestamp.isoformat(),
-                json.dumps(entry.data),
-                entry.hash,
-                entry.previous_hash,
-                entry.signature,
-                json.dumps(entry.metadata) if entry.metadata else None,
-                entry.nonce,
-            ))
+            """, self._entry_params(entry))
             
         except sqlite3.IntegrityError as e:
             if 'UNIQUE constraint failed' in str(e):
@@ -127,6 +132,34 @@ class SQLiteBackend(StorageBackend):
         except Exception as e:
             raise StorageError(f"Failed to append entry: {e}", "append", self.name)
     
+    def append_entries(self, entries: List[Entry]) -> None:
+        """Append several entries in a single transaction."""
+        conn = self._get_connection()
+        
+        try:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(f"""
+                    INSERT INTO {self.table_name} 
+                    (id, timestamp, data, hash, previous_hash, signature, metadata, nonce)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, [self._entry_params(entry) for entry in entries])
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            
+        except sqlite3.IntegrityError as e:
+            if 'UNIQUE constraint failed' in str(e):
+                raise StorageError(
+                    f"Batch contains an entry ID that already exists: {e}",
+                    "append",
+                    self.name
+                )
+            raise StorageError(f"Failed to append entries: {e}", "append", self.name)
+        except Exception as e:
+            raise StorageError(f"Failed to append entries: {e}", "append", self.name)
+    
     def get_entry(self, entry_id: str) -> Optional[Entry]:
         """Get entry by ID."""
         conn = self._get_connection()
@@ -1,35 +1,41 @@
 """Caching layer implementation for SignLedger."""
 
+import sys
 import time
 import threading
 import hashlib
 import json
-from typing import Any, Dict, Optional, List, Tuple, Callable
+from typing import Any, Dict, Optional, List, Tuple, Callable, Sequence
 from collections import OrderedDict
 from dataclasses import dataclass, field
 import logging
 import weakref
+from itertools import islice
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from ..core.entry import Entry
 from ..core.exceptions import CacheError
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# dataclass(slots=True) requires Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class CacheEntry:
-    """Cached ledger entry with metadata."""
+    """Snapshot of a cached ledger entry and its metadata."""
     entry: Entry
     cached_at: float = field(default_factory=time.time)
-    access_count: int = 0
-    last_accessed: float = field(default_factory=time.time)
     size_bytes: int = 0
     
-    def accessed(self):
-        """Update access statistics."""
-        self.access_count += 1
-        self.last_accessed = time.time()
-    
     def age(self) -> float:
         """Get age of cache entry in seconds."""
         return time.time() - self.cached_at
@@ -39,7 +45,7 @@ class CacheEntry:
         return self.age() > max_age
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CacheStats:
     """Cache performance statistics."""
     hits: int = 0
@@ -66,7 +72,18 @@ class CacheStats:
 
 
 class LRUCache:
-    """LRU cache for ledger entries."""
+    """LRU cache for ledger entries.
+    
+    Ledger entries are immutable, so TTL expiry only bounds memory use.
+    Stale entries are swept lazily from the least recently used end every
+    SWEEP_INTERVAL operations instead of being checked on every get.
+    
+    Per-entry metadata is kept in parallel dicts keyed by sequence rather
+    than in a wrapper object per entry.
+    """
+    
+    SWEEP_INTERVAL = 1024
+    SWEEP_BATCH = 256
     
     def __init__(
         self,
@@ -78,73 +95,164 @@ class LRUCache:
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.ttl_seconds = ttl_seconds
         
-        self._cache: OrderedDict[int, CacheEntry] = OrderedDict()
+        # Entries in LRU order, plus parallel metadata
+        self._entries: OrderedDict[int, Entry] = OrderedDict()
+        self._sizes: Dict[int, int] = {}
+        self._cached_at: Dict[int, float] = {}
+        
         self._lock = threading.RLock()
         self._stats = CacheStats()
+        self._ops_since_sweep = 0
+        
+        # Bumped whenever a cached entry is invalidated or replaced, so
+        # copies held outside the cache can tell they may be out of date
+        self.generation = 0
     
     def get(self, sequence: int) -> Optional[Entry]:
         """Get entry from cache."""
         with self._lock:
-            if sequence in self._cache:
-                cache_entry = self._cache[sequence]
-                
-                # Check if stale
-                if cache_entry.is_stale(self.ttl_seconds):
-                    del self._cache[sequence]
-                    self._stats.misses += 1
-                    return None
-                
-                # Move to end (most recently used)
-                self._cache.move_to_end(sequence)
-                cache_entry.accessed()
-                
-                self._stats.hits += 1
-                return cache_entry.entry
+            self._ops_since_sweep += 1
+            if self._ops_since_sweep >= self.SWEEP_INTERVAL:
+                self._sweep_stale()
             
-            self._stats.misses += 1
-            return None
+            entry = self._entries.get(sequence)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            
+            # Move to end (most recently used)
+            self._entries.move_to_end(sequence)
+            
+            self._stats.hits += 1
+            return entry
+    
+    def get_entry_info(self, sequence: int) -> Optional[CacheEntry]:
+        """Get cached entry with metadata without affecting LRU order or stats."""
+        with self._lock:
+            entry = self._entries.get(sequence)
+            if entry is None:
+                return None
+            return CacheEntry(
+                entry=entry,
+                cached_at=self._cached_at[sequence],
+                size_bytes=self._sizes[sequence]
+            )
     
     def put(self, entry: Entry) -> None:
         """Add entry to cache."""
+        # Sizing touches no shared state, so keep it out of the lock
+        size_bytes = self._compute_size(entry)
+        
         with self._lock:
-            # Calculate size
-            entry_json = json.dumps(entry.to_dict())
-            size_bytes = len(entry_json.encode('utf-8'))
+            self._ops_since_sweep += 1
+            if self._ops_since_sweep >= self.SWEEP_INTERVAL:
+                self._sweep_stale()
+            
+            # Drop a previous copy so it is not counted twice
+            if self._remove(entry.sequence):
+                self.generation += 1
             
             # Check if we need to evict
             while self._should_evict(size_bytes):
                 self._evict_oldest()
             
             # Add to cache
-            cache_entry = CacheEntry(
-                entry=entry,
-                size_bytes=size_bytes
-            )
-            
-            self._cache[entry.sequence] = cache_entry
+            sequence = entry.sequence
+            self._entries[sequence] = entry
+            self._sizes[sequence] = size_bytes
+            self._cached_at[sequence] = time.time()
             self._stats.total_size_bytes += size_bytes
-            self._stats.entry_count = len(self._cache)
+            self._stats.entry_count = len(self._entries)
+    
+    def put_many(self, entries: Sequence[Entry]) -> None:
+        """Add multiple entries to cache under a single lock acquisition."""
+        # Later duplicates win; only the newest max_entries can be retained
+        batch = list({entry.sequence: entry for entry in entries}.values())
+        batch = batch[-self.max_entries:] if self.max_entries > 0 else []
+        if not batch:
+            return
+        
+        sizes = [self._compute_size(entry) for entry in batch]
+        incoming_size = sum(sizes)
+        
+        # Like repeated put(), keep only the newest entries that fit the budget
+        skip = 0
+        while skip < len(batch) and incoming_size > self.max_size_bytes:
+            incoming_size -= sizes[skip]
+            skip += 1
+        if skip:
+            batch = batch[skip:]
+            sizes = sizes[skip:]
+            if not batch:
+                return
+        
+        with self._lock:
+            self._ops_since_sweep += len(batch)
+            if self._ops_since_sweep >= self.SWEEP_INTERVAL:
+                self._sweep_stale()
+            
+            # Drop entries being replaced so they are not counted twice
+            for entry in batch:
+                if self._remove(entry.sequence):
+                    self.generation += 1
+            
+            # One eviction pass for the aggregate new size
+            while self._entries and (
+                len(self._entries) + len(batch) > self.max_entries
+                or self._stats.total_size_bytes + incoming_size > self.max_size_bytes
+            ):
+                self._evict_oldest()
+            
+            now = time.time()
+            for entry, size_bytes in zip(batch, sizes):
+                sequence = entry.sequence
+                self._entries[sequence] = entry
+                self._sizes[sequence] = size_bytes
+                self._cached_at[sequence] = now
+            
+            self._stats.total_size_bytes += incoming_size
+            self._stats.entry_count = len(self._entries)
     
     def invalidate(self, sequence: int) -> bool:
         """Remove entry from cache."""
         with self._lock:
-            if sequence in self._cache:
-                cache_entry = self._cache.pop(sequence)
-                self._stats.total_size_bytes -= cache_entry.size_bytes
-                self._stats.entry_count = len(self._cache)
+            self.generation += 1
+            if self._remove(sequence):
+                self._stats.entry_count = len(self._entries)
                 return True
             return False
     
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
-            self._cache.clear()
+            self.generation += 1
+            self._entries.clear()
+            self._sizes.clear()
+            self._cached_at.clear()
             self._stats.total_size_bytes = 0
             self._stats.entry_count = 0
     
+    @staticmethod
+    def _compute_size(entry: Entry) -> int:
+        """Calculate the serialized size of an entry in bytes."""
+        if HAS_ORJSON:
+            try:
+                return len(orjson.dumps(entry.to_dict()))
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; measure with json instead
+        return len(json.dumps(entry.to_dict()).encode('utf-8'))
+    
+    def _remove(self, sequence: int) -> bool:
+        """Remove an entry and its metadata; caller updates entry_count."""
+        if self._entries.pop(sequence, None) is None:
+            return False
+        del self._cached_at[sequence]
+        self._stats.total_size_bytes -= self._sizes.pop(sequence)
+        return True
+    
     def _should_evict(self, new_size: int) -> bool:
         """Check if eviction is needed."""
-        if len(self._cache) >= self.max_entries:
+        if len(self._entries) >= self.max_entries:
             return True
         
         if self._stats.total_size_bytes + new_size > self.max_size_bytes:
@@ -154,11 +262,30 @@ class LRUCache:
     
     def _evict_oldest(self) -> None:
         """Evict least recently used entry."""
-        if self._cache:
-            sequence, cache_entry = self._cache.popitem(last=False)
+        if self._entries:
+            sequence, _ = self._entries.popitem(last=False)
+            del self._cached_at[sequence]
             self._stats.evictions += 1
-            self._stats.total_size_bytes -= cache_entry.size_bytes
-            self._stats.entry_count = len(self._cache)
+            self._stats.total_size_bytes -= self._sizes.pop(sequence)
+            self._stats.entry_count = len(self._entries)
+    
+    def _sweep_stale(self) -> None:
+        """Evict stale entries from the least recently used end."""
+        self._ops_since_sweep = 0
+        cutoff = time.time() - self.ttl_seconds
+        cached_at = self._cached_at
+        
+        stale = [
+            sequence
+            for sequence in islice(self._entries, self.SWEEP_BATCH)
+            if cached_at[sequence] < cutoff
+        ]
+        
+        for sequence in stale:
+            self._remove(sequence)
+        
+        if stale:
+            self._stats.entry_count = len(self._entries)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
@@ -170,7 +297,8 @@ class RangeCache:
     
     def __init__(self, max_ranges: int = 100):
         self.max_ranges = max_ranges
-        self._ranges: OrderedDict[Tuple[int, int], List[Entry]] = OrderedDict()
+        # Plain dicts keep insertion order; re-inserting a key moves it to the end
+        self._ranges: Dict[Tuple[int, int], List[Entry]] = {}
         self._lock = threading.RLock()
     
     def get_range(self, start: int, end: int) -> Optional[List[Entry]]:
@@ -179,8 +307,8 @@ class RangeCache:
             key = (start, end)
             if key in self._ranges:
                 # Move to end
-                self._ranges.move_to_end(key)
-                return self._ranges[key].copy()
+                entries = self._ranges[key] = self._ranges.pop(key)
+                return entries.copy()
             return None
     
     def put_range(self, start: int, end: int, entries: List[Entry]) -> None:
@@ -188,7 +316,7 @@ class RangeCache:
         with self._lock:
             # Evict if needed
             while len(self._ranges) >= self.max_ranges:
-                self._ranges.popitem(last=False)
+                del self._ranges[next(iter(self._ranges))]
             
             self._ranges[(start, end)] = entries.copy()
     
@@ -213,12 +341,22 @@ class RangeCache:
 
 
 class QueryCache:
-    """Cache for search queries."""
+    """Cache for search queries.
+    
+    Besides exact matches, a query whose ``data``/``metadata`` criteria add
+    scalar key/value constraints to a cached query (with all other criteria
+    equal) is answered by filtering the cached results in-process.
+    """
+    
+    _FILTER_FIELDS = ('data', 'metadata')
+    _SCALAR_TYPES = (str, int, float, bool, type(None))
     
     def __init__(self, max_queries: int = 500, ttl_seconds: float = 300):
         self.max_queries = max_queries
         self.ttl_seconds = ttl_seconds
-        self._queries: OrderedDict[str, Tuple[List[Entry], float]] = OrderedDict()
+        self._queries: Dict[str, Tuple[List[Entry], float]] = {}
+        # Cache key -> (key of the non-filter criteria, filter predicates)
+        self._criteria_index: Dict[str, Tuple[str, frozenset]] = {}
         self._lock = threading.RLock()
     
     def _get_query_key(self, criteria: Dict[str, Any]) -> str:
@@ -227,6 +365,28 @@ class QueryCache:
         sorted_criteria = json.dumps(criteria, sort_keys=True)
         return hashlib.sha256(sorted_criteria.encode()).hexdigest()
     
+    def _split_criteria(self, criteria: Dict[str, Any]) -> Optional[Tuple[str, frozenset]]:
+        """Split criteria into a key for the rest and scalar field predicates."""
+        rest = {}
+        predicates = []
+        
+        for name, value in criteria.items():
+            if name not in self._FILTER_FIELDS:
+                rest[name] = value
+                continue
+            if not isinstance(value, dict):
+                return None
+            for key, expected in value.items():
+                if not isinstance(expected, self._SCALAR_TYPES):
+                    return None
+                predicates.append((name, key, expected))
+        
+        try:
+            rest_key = json.dumps(rest, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return rest_key, frozenset(predicates)
+    
     def get(self, criteria: Dict[str, Any]) -> Optional[List[Entry]]:
         """Get cached query results."""
         with self._lock:
@@ -237,29 +397,66 @@ class QueryCache:
                 
                 # Check if stale
                 if time.time() - cached_at > self.ttl_seconds:
-                    del self._queries[key]
+                    self._drop(key)
                     return None
                 
                 # Move to end
-                self._queries.move_to_end(key)
+                self._queries[key] = self._queries.pop(key)
                 return entries.copy()
             
+            return self._get_narrowed(criteria)
+    
+    def _get_narrowed(self, criteria: Dict[str, Any]) -> Optional[List[Entry]]:
+        """Answer a query by filtering the results of a broader cached query."""
+        split = self._split_criteria(criteria)
+        if split is None:
             return None
+        rest_key, predicates = split
+        
+        now = time.time()
+        for key, (cached_rest_key, cached_predicates) in self._criteria_index.items():
+            if cached_rest_key != rest_key or not cached_predicates < predicates:
+                continue
+            
+            entries, cached_at = self._queries[key]
+            if now - cached_at > self.ttl_seconds:
+                continue
+            
+            extra = predicates - cached_predicates
+            return [
+                entry for entry in entries
+                if all(
+                    (getattr(entry, name, None) or {}).get(field, _MISSING) == expected
+                    for name, field, expected in extra
+                )
+            ]
+        
+        return None
     
     def put(self, criteria: Dict[str, Any], entries: List[Entry]) -> None:
         """Cache query results."""
         with self._lock:
             # Evict if needed
             while len(self._queries) >= self.max_queries:
-                self._queries.popitem(last=False)
+                self._drop(next(iter(self._queries)))
             
             key = self._get_query_key(criteria)
             self._queries[key] = (entries.copy(), time.time())
+            
+            split = self._split_criteria(criteria)
+            if split is not None:
+                self._criteria_index[key] = split
+    
+    def _drop(self, key: str) -> None:
+        """Remove a cached query and its index entry."""
+        del self._queries[key]
+        self._criteria_index.pop(key, None)
     
     def invalidate_all(self) -> None:
         """Invalidate all cached queries."""
         with self._lock:
             self._queries.clear()
+            self._criteria_index.clear()
 
 
 class CachedLedger:
@@ -280,40 +477,84 @@ class CachedLedger:
         self.range_cache = RangeCache() if enable_range_cache else None
         self.query_cache = QueryCache() if enable_query_cache else None
         
-        # Cache invalidation callbacks
-        self._invalidation_callbacks = []
+        # Per-thread most recently read entry, valid while the entry
+        # cache's generation matches
+        self._recent = threading.local()
+        
+        # Cache invalidation callbacks; a tuple rebuilt only when one is added
+        self._invalidation_callbacks: Tuple[Callable[[Entry], None], ...] = ()
     
     def append(self, data: Dict[str, Any]) -> Entry:
         """Append entry and update caches."""
         # Append to underlying ledger
         entry = self.ledger.append(data)
         
-        # Cache the new entry
+        self._entries_added([entry])
+        
+        return entry
+    
+    def append_many(self, data_list: List[Dict[str, Any]], *args, **kwargs) -> List[Any]:
+        """Append several entries and update caches once for the batch.
+        
+        Takes the same arguments as the ledger's ``append_many``; errors
+        returned in place of entries are passed through.
+        """
+        results = self.ledger.append_many(data_list, *args, **kwargs)
+        
+        self._entries_added([result for result in results if not isinstance(result, Exception)])
+        
+        return results
+    
+    def _entries_added(self, entries: List[Entry]) -> None:
+        """Cache newly appended entries and invalidate what they affect."""
+        if not entries:
+            return
+        
+        # Cache the new entries
         if self.entry_cache:
-            self.entry_cache.put(entry)
+            self.entry_cache.put_many(entries)
         
         # Invalidate affected caches
         if self.range_cache:
-            self.range_cache.invalidate_overlapping(entry.sequence)
+            for entry in entries:
+                self.range_cache.invalidate_overlapping(entry.sequence)
         
         if self.query_cache:
             self.query_cache.invalidate_all()
         
         # Notify callbacks
-        for callback in self._invalidation_callbacks:
-            try:
-                callback(entry)
-            except Exception as e:
-                logger.error(f"Invalidation callback error: {e}")
-        
-        return entry
+        if self._invalidation_callbacks:
+            for entry in entries:
+                for callback in self._invalidation_callbacks:
+                    try:
+                        callback(entry)
+                    except Exception as e:
+                        logger.error(f"Invalidation callback error: {e}")
     
     def get(self, sequence: int) -> Optional[Entry]:
-        """Get entry with caching."""
+        """Get entry with caching.
+        
+        Repeated reads of the same sequence by a thread are served from a
+        thread-local slot without taking the entry cache lock; such hits
+        are not counted in the entry cache statistics. Any invalidation
+        of the entry cache, including direct ``entry_cache.invalidate``
+        calls, bumps its generation and retires every thread's slot.
+        """
+        recent = self._recent
+        
         # Check cache first
         if self.entry_cache:
+            if (
+                getattr(recent, 'sequence', None) == sequence
+                and recent.generation == self.entry_cache.generation
+            ):
+                return recent.entry
+            
+            # Read before the lookup, so an invalidation racing it retires the slot
+            generation = self.entry_cache.generation
             cached = self.entry_cache.get(sequence)
             if cached:
+                self._remember(sequence, cached, generation)
                 return cached
         
         # Get from ledger
@@ -321,10 +562,23 @@ class CachedLedger:
         
         # Cache if found
         if entry and self.entry_cache:
+            generation = self.entry_cache.generation
             self.entry_cache.put(entry)
+            self._remember(sequence, entry, generation)
         
         return entry
     
+    def _remember(self, sequence: int, entry: Entry, generation: int) -> None:
+        """Record the entry last read by the current thread.
+        
+        ``generation`` is the entry cache's generation read before the
+        entry was looked up or stored.
+        """
+        recent = self._recent
+        recent.entry = entry
+        recent.generation = generation
+        recent.sequence = sequence
+    
     def get_range(self, start: int, end: int) -> List[Entry]:
         """Get range with caching."""
         # Check range cache
@@ -342,8 +596,7 @@ class CachedLedger:
         
         # Also cache individual entries
         if self.entry_cache:
-            for entry in entries:
-                self.entry_cache.put(entry)
+            self.entry_cache.put_many(entries)
         
         return entries
     
@@ -364,8 +617,7 @@ class CachedLedger:
         
         # Also cache individual entries
         if self.entry_cache:
-            for entry in entries:
-                self.entry_cache.put(entry)
+            self.entry_cache.put_many(entries)
         
         return entries
     
@@ -390,6 +642,7 @@ class CachedLedger:
     
     def clear_caches(self) -> None:
         """Clear all caches."""
+        # Clearing the entry cache also retires every thread's recent entry
         if self.entry_cache:
             self.entry_cache.clear()
         
@@ -401,7 +654,7 @@ class CachedLedger:
     
     def add_invalidation_callback(self, callback: Callable[[Entry], None]) -> None:
         """Add cache invalidation callback."""
-        self._invalidation_callbacks.append(callback)
+        self._invalidation_callbacks += (callback,)
     
     # Proxy other methods to underlying ledger
     def __getattr__(self, name):
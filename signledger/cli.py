@@ -5,7 +5,12 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from signledger import Ledger, __version__
 from signledger.backends.base import InMemoryBackend
@@ -85,29 +90,13 @@ def main():
             backend = _create_backend(args.backend, args.connection)
             ledger = Ledger(backend=backend, auto_verify=False)
             
-            entries = list(ledger.get_entries())
-            
-            if args.format == "json":
-                output = json.dumps([e.to_dict() for e in entries], indent=2)
-            else:  # CSV
-                import csv
-                import io
-                output_buffer = io.StringIO()
-                if entries:
-                    fieldnames = ["id", "timestamp", "hash", "previous_hash", "data"]
-                    writer = csv.DictWriter(output_buffer, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for entry in entries:
-                        row = entry.to_dict()
-                        row["data"] = json.dumps(row["data"])
-                        writer.writerow({k: row.get(k) for k in fieldnames})
-                output = output_buffer.getvalue()
-            
+            # Stream entries straight to the destination
             if args.output:
-                Path(args.output).write_text(output)
-                print(f"Exported {len(entries)} entries to {args.output}")
+                with open(args.output, "w", newline="") as out:
+                    count = _export_entries(ledger.get_entries(), out, args.format)
+                print(f"Exported {count} entries to {args.output}")
             else:
-                print(output)
+                _export_entries(ledger.get_entries(), sys.stdout, args.format)
                 
         elif args.command == "demo":
             print("SignLedger Interactive Demo")
@@ -168,6 +157,42 @@ def main():
     return 0
 
 
+def _dumps(obj) -> str:
+    """Serialize to compact JSON, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; fall back to json
+    return json.dumps(obj)
+
+
+def _export_entries(entries, out, export_format: str) -> int:
+    """Write entries to a text stream one at a time and return the count."""
+    count = 0
+    
+    if export_format == "json":
+        out.write("[")
+        for entry in entries:
+            out.write(",\n  " if count else "\n  ")
+            out.write(_dumps(entry.to_dict()))
+            count += 1
+        out.write("\n]\n" if count else "]\n")
+    else:  # CSV
+        import csv
+        fieldnames = ["id", "timestamp", "hash", "previous_hash", "data"]
+        writer = csv.DictWriter(out, fieldnames=fieldnames)
+        for entry in entries:
+            if not count:
+                writer.writeheader()
+            row = entry.to_dict()
+            row["data"] = _dumps(row["data"])
+            writer.writerow({k: row.get(k) for k in fieldnames})
+            count += 1
+    
+    return count
+
+
 def _create_backend(backend_type: str, connection: str = None):
     """Create backend instance based on type."""
     if backend_type == "memory":
@@ -5,13 +5,33 @@ import gzip
 import bz2
 import lzma
 import base64
+import io
 import json
 import pickle
+import math
+import os
+import sys
+import threading
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Union, Optional, Tuple, List
 from abc import ABC, abstractmethod
 from enum import Enum
 import logging
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +44,114 @@ class CompressionType(Enum):
     LZMA = "lzma"
     LZ4 = "lz4"  # Optional, requires lz4 package
     ZSTD = "zstd"  # Optional, requires zstandard package
+    ZSTD_DICT = "zstd_dict"  # Zstandard with a trained dictionary
+
+
+def _shannon_entropy(data: bytes) -> float:
+    """Estimate Shannon entropy of data in bits per byte."""
+    if not data:
+        return 0.0
+    
+    total = len(data)
+    entropy = 0.0
+    for count in Counter(data).values():
+        p = count / total
+        entropy -= p * math.log2(p)
+    return entropy
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a nested structure holds a NaN or infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+# Incompressibility check: a level-1 zlib pass over evenly spaced slices
+# that must shrink the sample below this ratio
+_TRIAL_SLICES = 8
+_TRIAL_SLICE_SIZE = 512
+_TRIAL_MIN_RATIO = 0.95
+
+
+# Share of an entry above which its binary values are stored uncompressed
+_BINARY_SPLIT_RATIO = 0.9
+
+# msgpack extension type standing in for a binary value stored after the
+# compressed remainder; the payload is the value's little-endian index
+_BLOB_EXT_CODE = 2
+
+
+def _binary_size(value: Any) -> int:
+    """Total size of the bytes values anywhere in a nested structure."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_binary_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_binary_size(v) for v in value)
+    return 0
+
+
+def _split_binary(value: Any, blobs: List[bytes]) -> Any:
+    """Move bytes values into ``blobs``, leaving indexed placeholders."""
+    if isinstance(value, (bytes, bytearray)):
+        blobs.append(bytes(value))
+        return msgpack.ExtType(_BLOB_EXT_CODE, (len(blobs) - 1).to_bytes(4, 'little'))
+    if isinstance(value, dict):
+        return {k: _split_binary(v, blobs) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_split_binary(v, blobs) for v in value]
+    return value
+
+
+# msgpack extension type for byte-shuffled int64 arrays
+_SHUFFLE_EXT_CODE = 1
+_SHUFFLE_MIN_LENGTH = 16
+
+
+def _shuffle_numeric_lists(value: Any) -> Any:
+    """Replace integer lists with byte-shuffled msgpack extension values.
+    
+    Bytes of each int64 are regrouped by position (all lowest bytes, then
+    the next, ...) so the mostly-constant high bytes form long runs.
+    """
+    if isinstance(value, dict):
+        return {k: _shuffle_numeric_lists(v) for k, v in value.items()}
+    if isinstance(value, list):
+        if len(value) >= _SHUFFLE_MIN_LENGTH and all(type(v) is int for v in value):
+            try:
+                arr = array('q', value)
+            except OverflowError:
+                pass
+            else:
+                if sys.byteorder != 'little':
+                    arr.byteswap()
+                raw = arr.tobytes()
+                return msgpack.ExtType(_SHUFFLE_EXT_CODE, b''.join(raw[i::8] for i in range(8)))
+        return [_shuffle_numeric_lists(v) for v in value]
+    return value
+
+
+def _shuffle_ext_hook(code: int, data: bytes) -> Any:
+    """Restore integer lists packed by ``_shuffle_numeric_lists``."""
+    if code != _SHUFFLE_EXT_CODE:
+        return msgpack.ExtType(code, data)
+    
+    count = len(data) // 8
+    raw = bytearray(len(data))
+    for i in range(8):
+        raw[i::8] = data[i * count:(i + 1) * count]
+    
+    arr = array('q')
+    arr.frombytes(raw)
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr.tolist()
 
 
 class CompressionStats:
@@ -37,6 +165,15 @@ class CompressionStats:
         self.compression_errors = 0
         self.decompression_errors = 0
     
+    def merge(self, other: "CompressionStats") -> None:
+        """Add another set of counters into this one."""
+        self.total_compressed += other.total_compressed
+        self.total_decompressed += other.total_decompressed
+        self.bytes_before_compression += other.bytes_before_compression
+        self.bytes_after_compression += other.bytes_after_compression
+        self.compression_errors += other.compression_errors
+        self.decompression_errors += other.decompression_errors
+    
     @property
     def compression_ratio(self) -> float:
         """Calculate average compression ratio."""
@@ -76,6 +213,14 @@ class Compressor(ABC):
         """Decompress data."""
         pass
     
+    def compress_stream(self, data: bytes, chunk_size: int = 64 * 1024) -> bytes:
+        """Compress large data incrementally.
+        
+        Output must be readable by ``decompress``. Codecs without a
+        streaming API compress in one shot.
+        """
+        return self.compress(data)
+    
     @property
     @abstractmethod
     def type(self) -> CompressionType:
@@ -98,7 +243,11 @@ class NoCompressor(Compressor):
 
 
 class ZlibCompressor(Compressor):
-    """Zlib compression."""
+    """Zlib compression.
+    
+    Compression state is not pooled: zlib objects cannot be reset, and
+    copying a primed ``compressobj`` costs more than the one-shot call.
+    """
     
     def __init__(self, level: int = 6):
         self.level = max(0, min(9, level))
@@ -106,6 +255,16 @@ class ZlibCompressor(Compressor):
     def compress(self, data: bytes) -> bytes:
         return zlib.compress(data, self.level)
     
+    def compress_stream(self, data: bytes, chunk_size: int = 64 * 1024) -> bytes:
+        compressor = zlib.compressobj(self.level)
+        view = memoryview(data)
+        parts = [
+            compressor.compress(view[i:i + chunk_size])
+            for i in range(0, len(view), chunk_size)
+        ]
+        parts.append(compressor.flush())
+        return b''.join(parts)
+    
     def decompress(self, data: bytes) -> bytes:
         return zlib.decompress(data)
     
@@ -166,7 +325,11 @@ class LzmaCompressor(Compressor):
 
 
 class Lz4Compressor(Compressor):
-    """LZ4 compression (optional, fast compression)."""
+    """LZ4 compression (optional, fast compression).
+    
+    The one-shot frame API is used deliberately; reusing an
+    ``LZ4FrameCompressor`` needs three calls per frame and is slower.
+    """
     
     def __init__(self, level: int = 0):
         try:
@@ -188,7 +351,11 @@ class Lz4Compressor(Compressor):
 
 
 class ZstdCompressor(Compressor):
-    """Zstandard compression (optional, modern compression)."""
+    """Zstandard compression (optional, modern compression).
+    
+    Compression contexts are reused across calls. They are not safe for
+    concurrent use, so each thread gets its own pair.
+    """
     
     def __init__(self, level: int = 3):
         try:
@@ -197,33 +364,135 @@ class ZstdCompressor(Compressor):
             self.level = level
         except ImportError:
             raise ImportError("zstandard is required for ZSTD compression. Install with: pip install zstandard")
+        
+        self._local = threading.local()
+    
+    def _contexts(self):
+        """Get this thread's compressor and decompressor contexts."""
+        local = self._local
+        if not hasattr(local, 'cctx'):
+            local.cctx = self.zstd.ZstdCompressor(level=self.level)
+            local.dctx = self.zstd.ZstdDecompressor()
+        return local
     
     def compress(self, data: bytes) -> bytes:
-        cctx = self.zstd.ZstdCompressor(level=self.level)
-        return cctx.compress(data)
+        return self._contexts().cctx.compress(data)
+    
+    def compress_stream(self, data: bytes, chunk_size: int = 64 * 1024) -> bytes:
+        # Declare the content size so the frame can still be read by decompress()
+        output = io.BytesIO()
+        view = memoryview(data)
+        with self._contexts().cctx.stream_writer(output, size=len(data), closefd=False) as writer:
+            for i in range(0, len(view), chunk_size):
+                writer.write(view[i:i + chunk_size])
+        return output.getvalue()
     
     def decompress(self, data: bytes) -> bytes:
-        dctx = self.zstd.ZstdDecompressor()
-        return dctx.decompress(data)
+        return self._contexts().dctx.decompress(data)
     
     @property
     def type(self) -> CompressionType:
         return CompressionType.ZSTD
 
 
+class ZstdDictCompressor(ZstdCompressor):
+    """Zstandard compression using a pre-trained dictionary.
+    
+    Small entries share most of their structure, so a dictionary trained
+    on earlier entries gives a much better ratio than plain zstd.
+    """
+    
+    def __init__(self, dict_data: bytes, level: int = 3):
+        super().__init__(level=level)
+        self.dictionary = self.zstd.ZstdCompressionDict(dict_data)
+        self.dict_id = self.dictionary.dict_id()
+    
+    def _contexts(self):
+        """Get this thread's dictionary-bound contexts."""
+        local = self._local
+        if not hasattr(local, 'cctx'):
+            local.cctx = self.zstd.ZstdCompressor(level=self.level, dict_data=self.dictionary)
+            local.dctx = self.zstd.ZstdDecompressor(dict_data=self.dictionary)
+        return local
+    
+    def as_bytes(self) -> bytes:
+        """Get the raw dictionary for persistence."""
+        return self.dictionary.as_bytes()
+    
+    @property
+    def type(self) -> CompressionType:
+        return CompressionType.ZSTD_DICT
+
+
 class CompressionManager:
-    """Manages compression for SignLedger entries."""
+    """Manages compression for SignLedger entries.
+    
+    Zstandard is the default when available, falling back to zlib.
+    ``level`` applies to zstd: around 3 suits the append path, 10-15 is
+    a balanced setting and 19-22 is meant for archival.
+    
+    With ``train_dictionary`` enabled, the first ``dictionary_samples``
+    serialized entries are used to train a zstd dictionary, after which
+    zstd output uses it. The dictionary must be persisted by the caller
+    (see ``get_dictionary``) and restored with ``load_dictionary`` before
+    reading entries written with it.
+    
+    Entries of ``stream_threshold`` bytes or more are fed to codecs with a
+    streaming API in chunks instead of being compressed in one shot.
+    
+    Entries are serialized with msgpack when it is installed, otherwise
+    as JSON. The serializer is recorded in the metadata so entries in
+    either format can be read back. With ``shuffle_numeric`` and msgpack,
+    lists of integers are packed as byte-shuffled int64 arrays, which
+    codecs compress far better than the raw integer encoding.
+    """
+    
+    # Recent exhaustive selections kept per entry shape
+    SELECTION_CACHE_SIZE = 128
     
     def __init__(
         self,
-        default_type: CompressionType = CompressionType.ZLIB,
+        default_type: CompressionType = CompressionType.ZSTD,
         compression_threshold: int = 1024,  # Don't compress below this size
-        auto_select: bool = False
+        auto_select: bool = False,
+        exhaustive_select: bool = False,
+        level: int = 3,
+        train_dictionary: bool = False,
+        dictionary_samples: int = 1024,
+        dictionary_size: int = 16 * 1024,
+        serializer: Optional[str] = None,
+        stream_threshold: int = 64 * 1024,
+        shuffle_numeric: bool = False
     ):
+        if serializer is None:
+            serializer = 'msgpack' if HAS_MSGPACK else 'json'
+        elif serializer == 'msgpack' and not HAS_MSGPACK:
+            raise ImportError("msgpack is required for msgpack serialization. Install with: pip install msgpack")
+        elif serializer not in ('json', 'msgpack'):
+            raise ValueError(f"Unknown serializer: {serializer}")
+        
+        self.serializer = serializer
+        self.stream_threshold = stream_threshold
+        self.shuffle_numeric = shuffle_numeric
         self.default_type = default_type
         self.compression_threshold = compression_threshold
         self.auto_select = auto_select
-        self.stats = CompressionStats()
+        self.exhaustive_select = exhaustive_select
+        self._selection_cache: Dict[Tuple[int, int], CompressionType] = {}
+        self.level = level
+        self.dictionary_samples = dictionary_samples
+        self.dictionary_size = dictionary_size
+        
+        # Each thread counts into its own stats; ``stats`` sums them
+        self._stats_lock = threading.Lock()
+        self._stats_local = threading.local()
+        self._thread_stats: List[CompressionStats] = []
+        
+        # Trained dictionaries by id; the newest one is used for writes.
+        # _dict_lock guards sampling, training and publishing a dictionary.
+        self._dictionaries: Dict[int, ZstdDictCompressor] = {}
+        self._dict_samples: Optional[List[bytes]] = None
+        self._dict_lock = threading.Lock()
         
         # Initialize compressors
         self._compressors = {
@@ -241,103 +510,376 @@ class CompressionManager:
             logger.debug("LZ4 compression not available")
         
         try:
-            self._compressors[CompressionType.ZSTD] = ZstdCompressor()
+            self._compressors[CompressionType.ZSTD] = ZstdCompressor(level=level)
         except ImportError:
             logger.debug("Zstandard compression not available")
+            if self.default_type == CompressionType.ZSTD:
+                self.default_type = CompressionType.ZLIB
+        else:
+            if train_dictionary:
+                self._dict_samples = []
+        
+        # Metadata stores the type's string value; look compressors up by it
+        self._compressors_by_str = {t.value: c for t, c in self._compressors.items()}
     
     def compress_entry(self, entry_data: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
         """Compress an entry and return compressed data with metadata."""
         # Serialize entry data
-        serialized = json.dumps(entry_data, separators=(',', ':')).encode('utf-8')
+        encoding, serialized = self._serialize(entry_data)
         original_size = len(serialized)
         
+        if self._dict_samples is not None:
+            self._collect_sample(serialized)
+        
         # Check if compression is worthwhile
-        if original_size < self.compression_threshold:
-            self.stats.total_compressed += 1
-            self.stats.bytes_before_compression += original_size
-            self.stats.bytes_after_compression += original_size
+        entropy_skip = False
+        if original_size >= self.compression_threshold and not self.auto_select:
+            # Binary values (at any depth) are usually already compressed,
+            # encrypted or random; only the rest is worth compressing.
+            # Binary values only serialize with msgpack.
+            if (
+                encoding.get('serializer') == 'msgpack'
+                and _binary_size(entry_data) > _BINARY_SPLIT_RATIO * original_size
+            ):
+                split = self._compress_split(entry_data, encoding, original_size)
+                if split is not None:
+                    return split
+            # Preconditioned bytes (e.g. shuffled byte planes) look random
+            # in isolation but compress well as a whole
+            if 'preconditioner' not in encoding:
+                entropy_skip = self._looks_incompressible(serialized)
+        if original_size < self.compression_threshold or entropy_skip:
+            stats = self._local_stats()
+            stats.total_compressed += 1
+            stats.bytes_before_compression += original_size
+            stats.bytes_after_compression += original_size
             
-            return serialized, {
+            metadata = {
                 'compression': CompressionType.NONE.value,
                 'original_size': original_size,
                 'compressed_size': original_size,
             }
+            if entropy_skip:
+                metadata['entropy_skip'] = True
+            metadata.update(encoding)
+            
+            return serialized, metadata
         
         # Select compression type
+        compressed = None
         if self.auto_select:
-            compression_type = self._auto_select_compression(serialized)
+            compression_type, compressed = self._auto_select_compression(serialized)
         else:
             compression_type = self.default_type
         
+        # Read once so a dictionary published meanwhile can't swap in
+        # between choosing the compressor and recording its dict_id
+        dict_compressor = self._compressors.get(CompressionType.ZSTD_DICT)
+        if compression_type == CompressionType.ZSTD and dict_compressor is not None:
+            compression_type = CompressionType.ZSTD_DICT
+            compressed = None
+        
         # Compress
         try:
-            compressor = self._compressors.get(compression_type)
+            if compression_type == CompressionType.ZSTD_DICT:
+                compressor = dict_compressor
+            else:
+                compressor = self._compressors.get(compression_type)
             if not compressor:
                 raise ValueError(f"Compressor not available: {compression_type}")
             
-            compressed = compressor.compress(serialized)
+            # Selection may already have compressed the whole input
+            if compressed is None:
+                if original_size >= self.stream_threshold:
+                    compressed = compressor.compress_stream(serialized)
+                else:
+                    compressed = compressor.compress(serialized)
             compressed_size = len(compressed)
             
             # Update stats
-            self.stats.total_compressed += 1
-            self.stats.bytes_before_compression += original_size
-            self.stats.bytes_after_compression += compressed_size
+            stats = self._local_stats()
+            stats.total_compressed += 1
+            stats.bytes_before_compression += original_size
+            stats.bytes_after_compression += compressed_size
             
             # Return compressed data with metadata
-            return compressed, {
+            metadata = {
                 'compression': compression_type.value,
                 'original_size': original_size,
                 'compressed_size': compressed_size,
                 'compression_ratio': 1.0 - (compressed_size / original_size),
             }
+            if compression_type == CompressionType.ZSTD_DICT:
+                metadata['dict_id'] = compressor.dict_id
+            metadata.update(encoding)
+            
+            return compressed, metadata
             
         except Exception as e:
             logger.error(f"Compression failed: {e}")
-            self.stats.compression_errors += 1
+            self._local_stats().compression_errors += 1
             
             # Fall back to uncompressed
-            return serialized, {
+            metadata = {
                 'compression': CompressionType.NONE.value,
                 'original_size': original_size,
                 'compressed_size': original_size,
                 'error': str(e),
             }
+            metadata.update(encoding)
+            
+            return serialized, metadata
     
     def decompress_entry(self, compressed_data: bytes, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Decompress an entry using metadata."""
         compression_type_str = metadata.get('compression', CompressionType.NONE.value)
         
         try:
-            # Get compression type
-            compression_type = CompressionType(compression_type_str)
-            
             # Get compressor
-            compressor = self._compressors.get(compression_type)
+            if compression_type_str == CompressionType.ZSTD_DICT.value:
+                compressor = self._dictionaries.get(metadata.get('dict_id'))
+            else:
+                compressor = self._compressors_by_str.get(compression_type_str)
             if not compressor:
-                raise ValueError(f"Compressor not available: {compression_type}")
+                raise ValueError(f"Compressor not available: {compression_type_str}")
+            
+            blob_sizes = metadata.get('blob_sizes')
+            if blob_sizes is not None:
+                entry = self._decompress_split(compressor, compressed_data, metadata['remainder_size'], blob_sizes)
+                self._local_stats().total_decompressed += 1
+                return entry
             
             # Decompress
             decompressed = compressor.decompress(compressed_data)
             
             # Update stats
-            self.stats.total_decompressed += 1
+            self._local_stats().total_decompressed += 1
             
-            # Parse JSON
+            # Deserialize; entries without a serializer tag are JSON
+            if metadata.get('serializer') == 'msgpack':
+                if not HAS_MSGPACK:
+                    raise ImportError("msgpack is required to read this entry. Install with: pip install msgpack")
+                if metadata.get('preconditioner') == 'shuffle8':
+                    return msgpack.unpackb(decompressed, raw=False, ext_hook=_shuffle_ext_hook)
+                return msgpack.unpackb(decompressed, raw=False)
+            if HAS_ORJSON:
+                try:
+                    return orjson.loads(decompressed)
+                except orjson.JSONDecodeError:
+                    pass  # e.g. NaN written by json.dumps, which orjson rejects
             return json.loads(decompressed.decode('utf-8'))
             
         except Exception as e:
             logger.error(f"Decompression failed: {e}")
-            self.stats.decompression_errors += 1
+            self._local_stats().decompression_errors += 1
             raise
     
-    def _auto_select_compression(self, data: bytes) -> CompressionType:
-        """Automatically select best compression type."""
+    @staticmethod
+    def _looks_incompressible(serialized: bytes) -> bool:
+        """Check whether a fast trial compress of a sample saves nothing.
+        
+        The sample is taken from slices spread across the buffer, so a
+        random value that happens to serialize first doesn't decide for
+        the whole entry.
+        """
+        size = len(serialized)
+        if size <= _TRIAL_SLICES * _TRIAL_SLICE_SIZE:
+            sample = serialized
+        else:
+            step = (size - _TRIAL_SLICE_SIZE) // (_TRIAL_SLICES - 1)
+            sample = b''.join(
+                serialized[i * step:i * step + _TRIAL_SLICE_SIZE]
+                for i in range(_TRIAL_SLICES)
+            )
+        return len(zlib.compress(sample, 1)) > _TRIAL_MIN_RATIO * len(sample)
+    
+    def _compress_split(
+        self,
+        entry_data: Dict[str, Any],
+        encoding: Dict[str, str],
+        original_size: int
+    ) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Compress everything but an entry's binary values.
+        
+        Binary values are replaced by placeholders and the remainder is
+        compressed; the values follow it uncompressed, their sizes kept in
+        ``blob_sizes`` and the remainder's in ``remainder_size``. Returns
+        None if the remainder can't be compressed.
+        """
+        blobs: List[bytes] = []
+        skeleton = _split_binary(entry_data, blobs)
+        if encoding.get('preconditioner') == 'shuffle8':
+            skeleton = _shuffle_numeric_lists(skeleton)
+        
+        try:
+            packed = msgpack.packb(skeleton, use_bin_type=True)
+            compression_type = self.default_type
+            if len(packed) < self.compression_threshold:
+                compression_type = CompressionType.NONE
+            compressor = self._compressors.get(compression_type)
+            if not compressor:
+                raise ValueError(f"Compressor not available: {compression_type}")
+            remainder = compressor.compress(packed)
+        except Exception as e:
+            logger.error(f"Compression failed: {e}")
+            self._local_stats().compression_errors += 1
+            return None
+        
+        compressed = b''.join([remainder, *blobs])
+        compressed_size = len(compressed)
+        
+        stats = self._local_stats()
+        stats.total_compressed += 1
+        stats.bytes_before_compression += original_size
+        stats.bytes_after_compression += compressed_size
+        
+        metadata = {
+            'compression': compression_type.value,
+            'original_size': original_size,
+            'compressed_size': compressed_size,
+            'compression_ratio': 1.0 - (compressed_size / original_size),
+            'remainder_size': len(remainder),
+            'blob_sizes': [len(blob) for blob in blobs],
+        }
+        metadata.update(encoding)
+        
+        return compressed, metadata
+    
+    @staticmethod
+    def _decompress_split(
+        compressor: 'Compressor',
+        compressed_data: bytes,
+        remainder_size: int,
+        blob_sizes: List[int]
+    ) -> Dict[str, Any]:
+        """Reassemble an entry written by ``_compress_split``."""
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack is required to read this entry. Install with: pip install msgpack")
+        
+        view = memoryview(compressed_data)
+        packed = compressor.decompress(bytes(view[:remainder_size]))
+        
+        blobs = []
+        offset = remainder_size
+        for size in blob_sizes:
+            blobs.append(bytes(view[offset:offset + size]))
+            offset += size
+        
+        def ext_hook(code: int, data: bytes) -> Any:
+            if code == _BLOB_EXT_CODE:
+                return blobs[int.from_bytes(data, 'little')]
+            return _shuffle_ext_hook(code, data)
+        
+        return msgpack.unpackb(packed, raw=False, ext_hook=ext_hook)
+    
+    def _serialize(self, entry_data: Dict[str, Any]) -> Tuple[Dict[str, str], bytes]:
+        """Serialize entry data.
+        
+        Returns the encoding metadata (empty for plain JSON) and the bytes.
+        """
+        if self.serializer == 'msgpack':
+            try:
+                if self.shuffle_numeric:
+                    packed = msgpack.packb(_shuffle_numeric_lists(entry_data), use_bin_type=True)
+                    return {'serializer': 'msgpack', 'preconditioner': 'shuffle8'}, packed
+                return {'serializer': 'msgpack'}, msgpack.packb(entry_data, use_bin_type=True)
+            except (TypeError, OverflowError):
+                pass  # e.g. integers beyond 64 bits; store as JSON instead
+        if HAS_ORJSON:
+            try:
+                serialized = orjson.dumps(entry_data)
+            except TypeError:
+                pass  # e.g. non-string keys or integers beyond 64 bits
+            else:
+                # orjson writes NaN and infinities as null; json.dumps keeps them
+                if b'null' not in serialized or not _has_non_finite(entry_data):
+                    return {}, serialized
+        return {}, json.dumps(entry_data, separators=(',', ':')).encode('utf-8')
+    
+    def _collect_sample(self, serialized: bytes):
+        """Record a training sample and train once enough are collected.
+        
+        Runs under _dict_lock so concurrent writers train exactly once.
+        """
+        with self._dict_lock:
+            samples = self._dict_samples
+            if samples is None:
+                # Another thread finished sampling since the caller checked
+                return
+            samples.append(serialized)
+            if len(samples) < self.dictionary_samples:
+                return
+            
+            self._dict_samples = None
+            zstd = self._compressors[CompressionType.ZSTD].zstd
+            try:
+                trained = zstd.train_dictionary(self.dictionary_size, samples)
+            except Exception as e:
+                logger.warning(f"Zstandard dictionary training failed: {e}")
+                return
+            
+            self._publish_dictionary(trained.as_bytes())
+    
+    def load_dictionary(self, dict_data: bytes) -> int:
+        """Load a zstd dictionary and use it for new entries.
+        
+        Returns the dictionary id recorded in entry metadata.
+        """
+        with self._dict_lock:
+            return self._publish_dictionary(dict_data)
+    
+    def _publish_dictionary(self, dict_data: bytes) -> int:
+        """Register a dictionary for reads, then use it for writes; caller holds _dict_lock."""
+        compressor = ZstdDictCompressor(dict_data, level=self.level)
+        self._dictionaries[compressor.dict_id] = compressor
+        self._compressors[CompressionType.ZSTD_DICT] = compressor
+        return compressor.dict_id
+    
+    def get_dictionary(self) -> Optional[bytes]:
+        """Get the active zstd dictionary, if one has been trained or loaded."""
+        with self._dict_lock:
+            compressor = self._compressors.get(CompressionType.ZSTD_DICT)
+        if compressor is None:
+            return None
+        return compressor.as_bytes()
+    
+    def _auto_select_compression(self, data: bytes) -> Tuple[CompressionType, Optional[bytes]]:
+        """Automatically select best compression type.
+        
+        Data that looks incompressible is stored as-is; everything else
+        goes to zstd (or zlib without it), which is rarely beaten on
+        speed and ratio together. ``exhaustive_select`` switches to
+        trial-compressing a sample with every codec.
+        
+        Returns the selected type and, when the selection already
+        compressed all of ``data`` with it, the compressed bytes.
+        """
+        if self.exhaustive_select:
+            return self._trial_select_compression(data)
+        
+        sample = data[:4096]
+        if _shannon_entropy(sample) > 7.5:
+            return CompressionType.NONE, None
+        
+        if CompressionType.ZSTD in self._compressors:
+            return CompressionType.ZSTD, None
+        return CompressionType.ZLIB, None
+    
+    def _trial_select_compression(self, data: bytes) -> Tuple[CompressionType, Optional[bytes]]:
+        """Select a compression type by compressing a sample with each codec."""
+        # Similar-shaped entries get the same answer; reuse recent selections
+        key = (len(data) // 1024, hash(data[:64]))
+        cached = self._selection_cache.get(key)
+        if cached is not None:
+            return cached, None
+        
         # Simple heuristic: test a few algorithms on a sample
         sample_size = min(len(data), 10240)  # Test on first 10KB
         sample = data[:sample_size]
         
         best_type = CompressionType.NONE
         best_ratio = 0.0
+        best_compressed = None
         
         # Test each available compressor
         for comp_type, compressor in self._compressors.items():
@@ -357,15 +899,43 @@ class CompressionManager:
                 if ratio > best_ratio:
                     best_ratio = ratio
                     best_type = comp_type
+                    best_compressed = compressed
                     
             except Exception:
                 continue
         
         # Only compress if we get at least 20% reduction
         if best_ratio < 0.2:
-            return CompressionType.NONE
+            best_type = CompressionType.NONE
+            best_compressed = None
+        
+        if len(self._selection_cache) >= self.SELECTION_CACHE_SIZE:
+            del self._selection_cache[next(iter(self._selection_cache))]
+        self._selection_cache[key] = best_type
         
-        return best_type
+        # The sample was the whole input, so its output can be reused
+        if sample_size < len(data):
+            best_compressed = None
+        return best_type, best_compressed
+    
+    def _local_stats(self) -> CompressionStats:
+        """Get the calling thread's stats counters."""
+        stats = getattr(self._stats_local, 'stats', None)
+        if stats is None:
+            stats = CompressionStats()
+            with self._stats_lock:
+                self._thread_stats.append(stats)
+                self._stats_local.stats = stats
+        return stats
+    
+    @property
+    def stats(self) -> CompressionStats:
+        """Compression statistics summed across threads."""
+        total = CompressionStats()
+        with self._stats_lock:
+            for stats in self._thread_stats:
+                total.merge(stats)
+        return total
     
     def get_stats(self) -> Dict[str, Any]:
         """Get compression statistics."""
@@ -373,24 +943,40 @@ class CompressionManager:
     
     def reset_stats(self):
         """Reset statistics."""
-        self.stats = CompressionStats()
+        with self._stats_lock:
+            self._thread_stats = []
+            self._stats_local = threading.local()
 
 
 class CompressedStorageWrapper:
-    """Wrapper for storage backends to add compression support."""
+    """Wrapper for storage backends to add compression support.
+    
+    Large ``get_range`` results are decompressed on a thread pool; zlib
+    and zstd release the GIL while decompressing.
+    """
     
-    def __init__(self, backend, compression_manager: Optional[CompressionManager] = None):
+    # Smallest range worth spreading across worker threads
+    PARALLEL_THRESHOLD = 256
+    
+    def __init__(
+        self,
+        backend,
+        compression_manager: Optional[CompressionManager] = None,
+        max_workers: Optional[int] = None
+    ):
         self.backend = backend
         self.compression_manager = compression_manager or CompressionManager()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ThreadPoolExecutor] = None
     
     def append(self, entry_data: Dict[str, Any]) -> int:
         """Append compressed entry."""
         # Compress entry
         compressed_data, compression_metadata = self.compression_manager.compress_entry(entry_data)
         
-        # Create wrapper entry
+        # Create wrapper entry; compressed bytes are stored as-is
         wrapped_entry = {
-            'compressed_data': base64.b64encode(compressed_data).decode('utf-8'),
+            'compressed_data': compressed_data,
             'compression_metadata': compression_metadata,
             'sequence': entry_data.get('sequence'),
             'timestamp': entry_data.get('timestamp'),
@@ -399,18 +985,26 @@ class CompressedStorageWrapper:
         # Store wrapped entry
         return self.backend.append(wrapped_entry)
     
+    def _unwrap(self, wrapped_entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Decompress a wrapped entry."""
+        compressed_data = wrapped_entry['compressed_data']
+        
+        # Entries written by older versions hold base64 text
+        if isinstance(compressed_data, str):
+            compressed_data = base64.b64decode(compressed_data)
+        
+        return self.compression_manager.decompress_entry(
+            compressed_data,
+            wrapped_entry['compression_metadata']
+        )
+    
     def get(self, sequence: int) -> Optional[Dict[str, Any]]:
         """Get and decompress entry."""
         wrapped_entry = self.backend.get(sequence)
         if not wrapped_entry:
             return None
         
-        # Extract compressed data
-        compressed_data = base64.b64decode(wrapped_entry['compressed_data'])
-        compression_metadata = wrapped_entry['compression_metadata']
-        
-        # Decompress
-        return self.compression_manager.decompress_entry(compressed_data, compression_metadata)
+        return self._unwrap(wrapped_entry)
     
     def get_latest(self) -> Optional[Dict[str, Any]]:
         """Get latest entry."""
@@ -418,30 +1012,37 @@ class CompressedStorageWrapper:
         if not wrapped_entry:
             return None
         
-        # Extract and decompress
-        compressed_data = base64.b64decode(wrapped_entry['compressed_data'])
-        compression_metadata = wrapped_entry['compression_metadata']
-        
-        return self.compression_manager.decompress_entry(compressed_data, compression_metadata)
+        return self._unwrap(wrapped_entry)
     
     def get_range(self, start: int, end: int) -> List[Dict[str, Any]]:
         """Get range of entries."""
         wrapped_entries = self.backend.get_range(start, end)
         
-        decompressed_entries = []
-        for wrapped in wrapped_entries:
-            compressed_data = base64.b64decode(wrapped['compressed_data'])
-            compression_metadata = wrapped['compression_metadata']
-            
-            try:
-                entry = self.compression_manager.decompress_entry(compressed_data, compression_metadata)
-                decompressed_entries.append(entry)
-            except Exception as e:
-                logger.error(f"Failed to decompress entry: {e}")
+        if self.max_workers > 1 and len(wrapped_entries) >= self.PARALLEL_THRESHOLD:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="CompressedStorage-Worker"
+                )
+            results = self._pool.map(self._decode_one, wrapped_entries, chunksize=32)
+        else:
+            results = map(self._decode_one, wrapped_entries)
         
-        return decompressed_entries
+        return [entry for entry in results if entry is not None]
+    
+    def _decode_one(self, wrapped_entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Decompress a wrapped entry, logging and skipping failures."""
+        try:
+            return self._unwrap(wrapped_entry)
+        except Exception as e:
+            logger.error(f"Failed to decompress entry: {e}")
+            return None
     
     def close(self):
         """Close backend."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        
         if hasattr(self.backend, 'close'):
-            self.backend.close()
\ No newline at end of file
+            self.backend.close()
@@ -1,12 +1,14 @@
 """Batch operations for SignLedger."""
 
+import sys
 import time
 import threading
 from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import logging
-import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from .ledger import Entry
@@ -14,21 +16,28 @@ from .exceptions import ValidationError, StorageError
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) requires Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class BatchOperation:
     """Represents a single operation in a batch."""
     operation_id: str
     data: Dict[str, Any]
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: Optional[datetime] = None
+    _iso: str = field(default='', init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now(timezone.utc)
+        
+        # Formatted once here rather than on every write
+        self._iso = self.timestamp.isoformat()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchResult:
     """Result of a batch operation."""
     successful_entries: List[Entry]
@@ -54,6 +63,9 @@ class BatchResult:
 class BatchProcessor:
     """Handles batch operations for the ledger."""
     
+    # Smallest sub-batch worth handing to a worker thread
+    MIN_PARALLEL_CHUNK = 32
+    
     def __init__(
         self,
         ledger,
@@ -70,11 +82,13 @@ class BatchProcessor:
         self.parallel_processing = parallel_processing
         self.num_workers = num_workers
         
-        self._batch_queue: queue.Queue = queue.Queue(maxsize=max_batch_size)
+        # Guarded by _lock
+        self._batch_queue: deque = deque()
         self._lock = threading.RLock()
         self._auto_commit_thread = None
         self._stop_auto_commit = threading.Event()
         self._processing = False
+        self._pool: Optional[ThreadPoolExecutor] = None
         
         # Statistics
         self._total_processed = 0
@@ -87,13 +101,13 @@ class BatchProcessor:
     def add_operation(self, operation: BatchOperation) -> None:
         """Add an operation to the batch queue."""
         with self._lock:
-            if self._batch_queue.qsize() >= self.max_batch_size:
+            if len(self._batch_queue) >= self.max_batch_size:
                 raise ValidationError("Batch queue is full")
             
-            self._batch_queue.put(operation)
+            self._batch_queue.append(operation)
             
             # Check if we should auto-commit
-            if self._batch_queue.qsize() >= self.auto_commit_threshold:
+            if len(self._batch_queue) >= self.auto_commit_threshold:
                 self._process_batch()
     
     def add_data(self, data: Dict[str, Any], **metadata) -> None:
@@ -119,12 +133,8 @@ class BatchProcessor:
         start_time = time.time()
         
         # Collect all operations
-        operations = []
-        while not self._batch_queue.empty():
-            try:
-                operations.append(self._batch_queue.get_nowait())
-            except queue.Empty:
-                break
+        operations = list(self._batch_queue)
+        self._batch_queue.clear()
         
         if not operations:
             self._processing = False
@@ -143,33 +153,52 @@ class BatchProcessor:
         finally:
             self._processing = False
     
-    def _process_sequential(self, operations: List[BatchOperation], start_time: float) -> BatchResult:
-        """Process operations sequentially."""
+    @staticmethod
+    def _entry_data(operation: BatchOperation) -> Dict[str, Any]:
+        """Build ledger entry data for an operation."""
+        # Copy and fill in place; operation data wins on key clashes
+        entry_data = operation.data.copy()
+        entry_data.setdefault('batch_id', operation.operation_id)
+        entry_data.setdefault('timestamp', operation._iso)
+        
+        # Add metadata if present
+        if operation.metadata:
+            entry_data['batch_metadata'] = operation.metadata
+        
+        return entry_data
+    
+    def _append_operations(
+        self,
+        operations: List[BatchOperation]
+    ) -> Tuple[List[Entry], List[Tuple[BatchOperation, Exception]]]:
+        """Append operations to the ledger in one batch write."""
         successful_entries = []
         failed_operations = []
         
-        for operation in operations:
-            try:
-                # Prepare entry data
-                entry_data = {
-                    'batch_id': operation.operation_id,
-                    'timestamp': operation.timestamp.isoformat(),
-                    **operation.data
-                }
-                
-                # Add metadata if present
-                if operation.metadata:
-                    entry_data['batch_metadata'] = operation.metadata
-                
-                # Append to ledger
-                entry = self.ledger.append(entry_data)
-                successful_entries.append(entry)
-                self._total_processed += 1
-                
-            except Exception as e:
-                failed_operations.append((operation, e))
-                self._total_failed += 1
-                logger.error(f"Failed to process batch operation {operation.operation_id}: {e}")
+        try:
+            results = self.ledger.append_many(
+                [self._entry_data(op) for op in operations],
+                return_exceptions=True
+            )
+        except Exception as e:
+            # Failed before anything was written, e.g. reading the chain head;
+            # storage failures come back per entry
+            results = [e] * len(operations)
+        
+        for operation, result in zip(operations, results):
+            if isinstance(result, Exception):
+                failed_operations.append((operation, result))
+                logger.error(f"Failed to process batch operation {operation.operation_id}: {result}")
+            else:
+                successful_entries.append(result)
+        
+        return successful_entries, failed_operations
+    
+    def _process_sequential(self, operations: List[BatchOperation], start_time: float) -> BatchResult:
+        """Process operations sequentially."""
+        successful_entries, failed_operations = self._append_operations(operations)
+        self._total_processed += len(successful_entries)
+        self._total_failed += len(failed_operations)
         
         execution_time = (time.time() - start_time) * 1000
         
@@ -181,49 +210,33 @@ class BatchProcessor:
         )
     
     def _process_parallel(self, operations: List[BatchOperation], start_time: float) -> BatchResult:
-        """Process operations in parallel using thread pool."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        """Process operations in parallel using thread pool.
         
-        successful_entries = []
-        failed_operations = []
+        Operations are split into one sub-batch per worker, and each
+        sub-batch is written with a single ``append_many`` call. Batches
+        too small to fill more than one sub-batch are written inline.
+        """
+        chunk_size = max(-(-len(operations) // self.num_workers), self.MIN_PARALLEL_CHUNK)
         
-        def process_single(operation: BatchOperation) -> Tuple[Optional[Entry], Optional[Exception]]:
-            try:
-                entry_data = {
-                    'batch_id': operation.operation_id,
-                    'timestamp': operation.timestamp.isoformat(),
-                    **operation.data
-                }
-                
-                if operation.metadata:
-                    entry_data['batch_metadata'] = operation.metadata
-                
-                entry = self.ledger.append(entry_data)
-                return entry, None
-            except Exception as e:
-                return None, e
-        
-        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-            # Submit all operations
-            future_to_operation = {
-                executor.submit(process_single, op): op
-                for op in operations
-            }
+        if chunk_size >= len(operations):
+            successful_entries, failed_operations = self._append_operations(operations)
+        else:
+            chunks = [
+                operations[i:i + chunk_size]
+                for i in range(0, len(operations), chunk_size)
+            ]
             
-            # Collect results
-            for future in as_completed(future_to_operation):
-                operation = future_to_operation[future]
-                try:
-                    entry, error = future.result()
-                    if error:
-                        failed_operations.append((operation, error))
-                        self._total_failed += 1
-                    else:
-                        successful_entries.append(entry)
-                        self._total_processed += 1
-                except Exception as e:
-                    failed_operations.append((operation, e))
-                    self._total_failed += 1
+            successful_entries = []
+            failed_operations = []
+            
+            futures = [self._get_pool().submit(self._append_operations, chunk) for chunk in chunks]
+            for future in futures:
+                entries, failures = future.result()
+                successful_entries.extend(entries)
+                failed_operations.extend(failures)
+        
+        self._total_processed += len(successful_entries)
+        self._total_failed += len(failed_operations)
         
         execution_time = (time.time() - start_time) * 1000
         
@@ -234,12 +247,21 @@ class BatchProcessor:
             execution_time_ms=execution_time
         )
     
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it on first use."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.num_workers,
+                thread_name_prefix="BatchProcessor-Worker"
+            )
+        return self._pool
+    
     def _start_auto_commit(self):
         """Start auto-commit thread."""
         def auto_commit_loop():
             while not self._stop_auto_commit.wait(self.auto_commit_interval):
                 with self._lock:
-                    if not self._batch_queue.empty():
+                    if self._batch_queue:
                         try:
                             self._process_batch()
                         except Exception as e:
@@ -256,13 +278,18 @@ class BatchProcessor:
         """Stop the batch processor."""
         # Process any remaining operations
         with self._lock:
-            if not self._batch_queue.empty():
+            if self._batch_queue:
                 self._process_batch()
         
         # Stop auto-commit thread
         if self._auto_commit_thread:
             self._stop_auto_commit.set()
             self._auto_commit_thread.join(timeout=5)
+        
+        # Shut down worker pool
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
     
     def get_stats(self) -> Dict[str, Any]:
         """Get batch processor statistics."""
@@ -271,7 +298,7 @@ class BatchProcessor:
                 'total_processed': self._total_processed,
                 'total_failed': self._total_failed,
                 'success_rate': self._total_processed / (self._total_processed + self._total_failed) if (self._total_processed + self._total_failed) > 0 else 0,
-                'queue_size': self._batch_queue.qsize(),
+                'queue_size': len(self._batch_queue),
                 'is_processing': self._processing,
             }
     
@@ -334,11 +361,9 @@ class TransactionalBatch:
             # Process all operations
             for operation in self._operations:
                 try:
-                    entry_data = {
-                        'transaction_id': f"tx_{self._checkpoint}_{operation.operation_id}",
-                        'timestamp': operation.timestamp.isoformat(),
-                        **operation.data
-                    }
+                    entry_data = operation.data.copy()
+                    entry_data.setdefault('transaction_id', f"tx_{self._checkpoint}_{operation.operation_id}")
+                    entry_data.setdefault('timestamp', operation._iso)
                     
                     if operation.metadata:
                         entry_data['transaction_metadata'] = operation.metadata
@@ -390,23 +415,41 @@ class BatchValidator:
         self.validators.append(validator)
     
     def validate_batch(self, operations: List[BatchOperation]) -> Tuple[List[BatchOperation], List[Tuple[BatchOperation, str]]]:
-        """Validate all operations in a batch."""
+        """Validate all operations in a batch.
+        
+        Validators are expected to be side-effect free: an operation stops
+        at its first failing validator and is then re-checked to collect
+        every error message.
+        """
+        validators = self.validators
+        if not validators:
+            return list(operations), []
+        
         valid_operations = []
         invalid_operations = []
         
         for operation in operations:
-            errors = []
-            
-            for validator in self.validators:
-                try:
-                    if not validator(operation):
-                        errors.append(f"Validation failed: {validator.__name__}")
-                except Exception as e:
-                    errors.append(f"Validator error: {e}")
+            try:
+                passed = all(validator(operation) for validator in validators)
+            except Exception:
+                passed = False
             
-            if errors:
-                invalid_operations.append((operation, "; ".join(errors)))
-            else:
+            if passed:
                 valid_operations.append(operation)
+            else:
+                invalid_operations.append((operation, "; ".join(self._collect_errors(operation))))
+        
+        return valid_operations, invalid_operations
+    
+    def _collect_errors(self, operation: BatchOperation) -> List[str]:
+        """Run every validator on an operation and collect the failures."""
+        errors = []
+        
+        for validator in self.validators:
+            try:
+                if not validator(operation):
+                    errors.append(f"Validation failed: {validator.__name__}")
+            except Exception as e:
+                errors.append(f"Validator error: {e}")
         
-        return valid_operations, invalid_operations
\ No newline at end of file
+        return errors
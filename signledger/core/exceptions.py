@@ -53,6 +53,24 @@ class StorageError(SignLedgerError):
         self.backend = backend
 
 
+class PartialWriteError(StorageError):
+    """Raised when a batch write fails after storing some of its entries.
+    
+    ``stored_count`` entries at the start of the batch were written.
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        operation: str,
+        backend: Optional[str] = None,
+        stored_count: int = 0,
+    ):
+        super().__init__(message, operation, backend)
+        self.details["stored_count"] = stored_count
+        self.stored_count = stored_count
+
+
 class SignatureError(SignLedgerError):
     """Raised when signature verification fails."""
     
@@ -2,12 +2,40 @@
 
 import hashlib
 import json
+from json.encoder import encode_basestring_ascii
 from typing import Any, Dict, Union
 from datetime import datetime
 
 from ..core.exceptions import ValidationError
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize values json can't handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Canonical JSON used for entry hashes; the output format must not change
+_canonical_encoder = json.JSONEncoder(
+    sort_keys=True,
+    separators=(',', ':'),
+    default=_json_default,
+)
+
+_entry_to_dict = None
+
+
+def _is_ledger_entry(entry: Any) -> bool:
+    """Check whether entry serializes exactly like a ledger Entry."""
+    global _entry_to_dict
+    if _entry_to_dict is None:
+        # Imported lazily; core.ledger imports this module
+        from ..core.ledger import Entry
+        _entry_to_dict = Entry.to_dict
+    return getattr(type(entry), "to_dict", None) is _entry_to_dict
+
+
 class HashChain:
     """Implements cryptographic hash chain for ledger entries."""
     
@@ -27,6 +55,7 @@ class HashChain:
         
         self.algorithm = algorithm
         self._hash_func = self.SUPPORTED_ALGORITHMS[algorithm]
+        self._genesis_hash = self._compute_genesis_hash()
     
     def calculate_hash(self, entry: Any) -> str:
         """Calculate hash for a ledger entry.
@@ -37,6 +66,9 @@ class HashChain:
         Returns:
             Hex-encoded hash string
         """
+        if _is_ledger_entry(entry):
+            return self._calculate_entry_hash(entry)
+        
         # Convert entry to dict if needed
         if hasattr(entry, "to_dict"):
             entry_dict = entry.to_dict()
@@ -49,11 +81,8 @@ class HashChain:
             if k not in ("hash", "signature")
         }
         
-        # Convert datetime objects to ISO format
-        data_to_hash = self._prepare_for_hashing(data_to_hash)
-        
-        # Create canonical JSON representation
-        canonical_json = json.dumps(data_to_hash, sort_keys=True, separators=(',', ':'))
+        # Create canonical JSON representation; datetimes become ISO strings
+        canonical_json = _canonical_encoder.encode(data_to_hash)
         
         # Calculate hash
         hasher = self._hash_func()
@@ -61,16 +90,29 @@ class HashChain:
         
         return hasher.hexdigest()
     
-    def _prepare_for_hashing(self, data: Any) -> Any:
-        """Prepare data for hashing by converting special types."""
-        if isinstance(data, datetime):
-            return data.isoformat()
-        elif isinstance(data, dict):
-            return {k: self._prepare_for_hashing(v) for k, v in data.items()}
-        elif isinstance(data, (list, tuple)):
-            return [self._prepare_for_hashing(item) for item in data]
-        else:
-            return data
+    def _calculate_entry_hash(self, entry: Any) -> str:
+        """Hash a ledger Entry without building intermediate dicts.
+        
+        Produces the same canonical JSON as the generic path: fields in
+        sorted key order, with only data and metadata going through the
+        encoder. A length-prefixed binary layout would hash no faster:
+        data and metadata still need canonical encoding, which dominates.
+        """
+        encode = _canonical_encoder.encode
+        previous_hash = entry.previous_hash
+        # Scalar fields skip the encoder and use the same C string escaper
+        # and int repr it would, saving a Python-level dispatch each
+        canonical_json = "".join((
+            '{"data":', encode(entry.data),
+            ',"id":', encode_basestring_ascii(entry.id),
+            ',"metadata":', encode(entry.metadata),
+            ',"nonce":', int.__repr__(entry.nonce),
+            ',"previous_hash":', "null" if previous_hash is None else encode_basestring_ascii(previous_hash),
+            ',"timestamp":', encode_basestring_ascii(entry.timestamp.isoformat()),
+            '}',
+        ))
+        
+        return self._hash_func(canonical_json.encode('utf-8')).hexdigest()
     
     def verify_hash(self, entry: Any, expected_hash: str) -> bool:
         """Verify the hash of an entry.
@@ -87,6 +129,10 @@ class HashChain:
     
     def create_genesis_hash(self) -> str:
         """Create hash for genesis block."""
+        return self._genesis_hash
+    
+    def _compute_genesis_hash(self) -> str:
+        """Hash the genesis block; depends only on the algorithm."""
         genesis_data = {
             "genesis": True,
             "algorithm": self.algorithm,
@@ -101,7 +147,11 @@ class HashChain:
 
 
 class MerkleTree:
-    """Merkle tree implementation for efficient verification."""
+    """Merkle tree implementation for efficient verification.
+    
+    Nodes are kept as raw digests and pairs are hashed over their
+    concatenated bytes; hashes are hex-encoded only at the API boundary.
+    """
     
     def __init__(self, hash_algorithm: str = "sha256"):
         self.hash_chain = HashChain(hash_algorithm)
@@ -122,7 +172,7 @@ class MerkleTree:
         
         # Create leaf nodes
         self._leaves = [
-            self.hash_chain.calculate_hash(entry)
+            bytes.fromhex(self.hash_chain.calculate_hash(entry))
             for entry in entries
         ]
         
@@ -131,25 +181,24 @@ class MerkleTree:
         current_level = self._leaves
         
         while len(current_level) > 1:
-            next_level = []
-            
-            # Process pairs
-            for i in range(0, len(current_level), 2):
-                if i + 1 < len(current_level):
-                    # Hash pair
-                    combined = current_level[i] + current_level[i + 1]
-                else:
-                    # Odd number, duplicate last hash
-                    combined = current_level[i] + current_level[i]
-                
-                hasher = self.hash_chain._hash_func()
-                hasher.update(combined.encode('utf-8'))
-                next_level.append(hasher.hexdigest())
-            
-            self._tree.append(next_level)
-            current_level = next_level
+            current_level = self._hash_level(current_level)
+            self._tree.append(current_level)
         
-        return current_level[0] if current_level else ""
+        return current_level[0].hex() if current_level else ""
+    
+    def _hash_level(self, level: list) -> list:
+        """Hash adjacent pairs of a level into the next level up."""
+        hash_func = self.hash_chain._hash_func
+        left = level[0::2]
+        right = level[1::2]
+        if len(level) % 2:
+            # Odd number, duplicate last hash
+            right.append(level[-1])
+        
+        # a + b builds one 64-byte object per pair; refilling a shared
+        # bytearray(64) instead costs two slice assignments per pair and
+        # measures slower under CPython.
+        return [hash_func(a + b).digest() for a, b in zip(left, right)]
     
     def get_proof(self, index: int) -> list:
         """Get Merkle proof for entry at given index.
@@ -176,7 +225,7 @@ class MerkleTree:
             # Add sibling hash if it exists
             if sibling_index < len(level):
                 proof.append({
-                    "hash": level[sibling_index],
+                    "hash": level[sibling_index].hex(),
                     "position": "right" if current_index % 2 == 0 else "left"
                 })
             
@@ -196,19 +245,23 @@ class MerkleTree:
         Returns:
             True if proof is valid
         """
-        current_hash = entry_hash
+        hash_func = self.hash_chain._hash_func
         
-        for proof_element in proof:
-            sibling_hash = proof_element["hash"]
-            position = proof_element["position"]
-            
-            if position == "left":
-                combined = sibling_hash + current_hash
-            else:
-                combined = current_hash + sibling_hash
+        try:
+            current_hash = bytes.fromhex(entry_hash)
             
-            hasher = self.hash_chain._hash_func()
-            hasher.update(combined.encode('utf-8'))
-            current_hash = hasher.hexdigest()
+            for proof_element in proof:
+                sibling_hash = bytes.fromhex(proof_element["hash"])
+                position = proof_element["position"]
+                
+                if position == "left":
+                    combined = sibling_hash + current_hash
+                else:
+                    combined = current_hash + sibling_hash
+                
+                current_hash = hash_func(combined).digest()
+        except ValueError:
+            # Not a hex-encoded hash
+            return False
         
-        return current_hash == root_hash
\ No newline at end of file
+        return current_hash.hex() == root_hash
\ No newline at end of file
@@ -3,17 +3,73 @@
 import hashlib
 import json
 import math
-from typing import List, Tuple, Optional, Dict, Any, Union
+from functools import lru_cache, partial
+from typing import List, Tuple, Optional, Dict, Any, Union, Callable
 from dataclasses import dataclass
 import logging
 
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
 logger = logging.getLogger(__name__)
 
+_SHA256 = hashlib.sha256
+
+# Same output as json.dumps(item, sort_keys=True), without building an
+# encoder per call
+_encode_sorted = json.JSONEncoder(sort_keys=True).encode
+
+
+@lru_cache(maxsize=1024)
+def _hash_self_pair(new_hash: Callable[..., Any], node_hash: bytes) -> bytes:
+    """Hash a node paired with itself.
+    
+    Odd levels pair their last node with itself; the same tails recur when
+    a growing tree is rebuilt or its root recomputed, so they are memoized.
+    """
+    return new_hash(node_hash + node_hash).digest()
+
+
+def _proof_root(new_hash: Callable[..., Any], proof: 'MerkleProof') -> bytes:
+    """Fold a proof path from its leaf up to the root digest it implies."""
+    current_hash = proof.leaf_hash
+    for sibling_hash, direction in proof.proof_path:
+        if direction == 'left':
+            # Sibling is on the left
+            current_hash = new_hash(sibling_hash + current_hash).digest()
+        else:
+            # Sibling is on the right
+            current_hash = new_hash(current_hash + sibling_hash).digest()
+    return current_hash
+
+
+def _leaf_bytes(item: Any) -> bytes:
+    """Serialize a data item for leaf hashing."""
+    if isinstance(item, dict):
+        return _encode_sorted(item).encode('utf-8')
+    return str(item).encode('utf-8')
+
+
+def _hash_constructor(hash_func: str) -> Callable[..., Any]:
+    """Resolve a hash name to its constructor once, skipping hashlib.new."""
+    if hash_func == 'sha256':
+        return _SHA256
+    if hash_func == 'blake3':
+        if not HAS_BLAKE3:
+            raise ImportError("blake3 is required for hash_func='blake3'. Install with: pip install blake3")
+        return blake3.blake3
+    # Fails early on unknown names, like hashlib.new would
+    hashlib.new(hash_func)
+    return getattr(hashlib, hash_func, None) or partial(hashlib.new, hash_func)
+
 
 @dataclass
 class MerkleNode:
-    """Represents a node in the Merkle tree."""
-    hash: str
+    """Represents a node in the Merkle tree; ``hash`` is the raw digest."""
+    hash: bytes
     left: Optional['MerkleNode'] = None
     right: Optional['MerkleNode'] = None
     is_leaf: bool = False
@@ -23,40 +79,94 @@ class MerkleNode:
 
 @dataclass
 class MerkleProof:
-    """Proof of inclusion for a leaf in the Merkle tree."""
-    leaf_hash: str
+    """Proof of inclusion for a leaf in the Merkle tree.
+    
+    Hashes are raw digests; ``to_dict``/``from_dict`` use hex strings.
+    ``cache_index`` is set when the path stops at a tree's cached layer
+    instead of the root (see ``MerkleTree``).
+    """
+    leaf_hash: bytes
     leaf_index: int
-    root_hash: str
-    proof_path: List[Tuple[str, str]]  # List of (hash, direction) tuples
+    root_hash: bytes
+    proof_path: List[Tuple[bytes, str]]  # List of (hash, direction) tuples
+    cache_index: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert proof to dictionary."""
-        return {
-            'leaf_hash': self.leaf_hash,
+        data = {
+            'leaf_hash': self.leaf_hash.hex(),
             'leaf_index': self.leaf_index,
-            'root_hash': self.root_hash,
-            'proof_path': self.proof_path
+            'root_hash': self.root_hash.hex(),
+            'proof_path': [(h.hex(), d) for h, d in self.proof_path]
         }
+        if self.cache_index is not None:
+            data['cache_index'] = self.cache_index
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MerkleProof':
         """Create proof from dictionary."""
         return cls(
-            leaf_hash=data['leaf_hash'],
+            leaf_hash=bytes.fromhex(data['leaf_hash']),
             leaf_index=data['leaf_index'],
-            root_hash=data['root_hash'],
-            proof_path=[(h, d) for h, d in data['proof_path']]
+            root_hash=bytes.fromhex(data['root_hash']),
+            proof_path=[(bytes.fromhex(h), d) for h, d in data['proof_path']],
+            cache_index=data.get('cache_index'),
         )
 
 
 class MerkleTree:
-    """Merkle tree for efficient verification of data integrity."""
+    """Merkle tree for efficient verification of data integrity.
     
-    def __init__(self, hash_func: str = 'sha256'):
+    ``hash_func`` is any hashlib algorithm name, or ``'blake3'`` when the
+    blake3 package is installed. Roots and proofs are specific to the hash
+    function that produced them.
+    
+    Nodes hold raw digests and parents hash the concatenated child
+    digests; roots and leaf hashes are hex-encoded at the API boundary.
+    ``build`` only computes the hashes of each level; the linked nodes
+    above the leaves are created the first time ``root`` is read.
+    
+    ``level_hasher`` replaces the per-level hashing used by ``build``, for
+    example with a batched GPU or native implementation. It receives a
+    level's digests and must return the next level: ``hash_func`` over
+    each adjacent pair's concatenation, pairing an odd last digest with
+    itself.
+    
+    ``cache_depth`` keeps the level ``cache_depth`` steps below the root
+    (at most ``2 ** cache_depth`` digests) as a cached layer. Proofs then
+    stop at that layer: they are ``cache_depth`` siblings shorter and
+    ``verify_proof`` checks them against the cached digest instead of
+    hashing up to the root. Such proofs can only be verified by a tree
+    holding the same layer, not by ``MerkleVerifier``. The default of 0
+    produces full proofs.
+    """
+    
+    def __init__(
+        self,
+        hash_func: str = 'sha256',
+        level_hasher: Optional[Callable[[List[bytes]], List[bytes]]] = None,
+        cache_depth: int = 0,
+    ):
+        if cache_depth < 0:
+            raise ValueError("cache_depth must not be negative")
         self.hash_func = hash_func
-        self.root: Optional[MerkleNode] = None
+        self._new_hash = _hash_constructor(hash_func)
+        self._level_hasher = level_hasher or self._hash_level
+        self.cache_depth = cache_depth
+        self._cache_depth = 0  # Effective depth for the current build
+        self._cache_layer: List[bytes] = []
         self.leaves: List[MerkleNode] = []
-        self._leaf_map: Dict[str, int] = {}  # Hash to index mapping
+        self._levels: List[List[bytes]] = []  # Hashes per level, leaves first
+        self._root: Optional[MerkleNode] = None
+        self._leaf_map: Dict[bytes, int] = {}  # Hash to index mapping
+    
+    @property
+    def root(self) -> Optional[MerkleNode]:
+        """Root node of the tree, or None before ``build``."""
+        if self._root is None and self._levels:
+            self._root = self._build_nodes()
+        return self._root
     
     def build(self, data_items: List[Union[str, Dict[str, Any]]]) -> str:
         """Build Merkle tree from data items."""
@@ -68,13 +178,7 @@ class MerkleTree:
         self._leaf_map = {}
         
         for i, item in enumerate(data_items):
-            # Convert to string if needed
-            if isinstance(item, dict):
-                item_str = json.dumps(item, sort_keys=True)
-            else:
-                item_str = str(item)
-            
-            leaf_hash = self._hash(item_str)
+            leaf_hash = self._hash(_leaf_bytes(item))
             leaf_node = MerkleNode(
                 hash=leaf_hash,
                 is_leaf=True,
@@ -85,41 +189,44 @@ class MerkleTree:
             self._leaf_map[leaf_hash] = i
         
         # Build tree
-        self.root = self._build_tree(self.leaves)
-        return self.root.hash
+        self._levels = self._build_tree([leaf.hash for leaf in self.leaves])
+        self._root = None
+        # Clamped for trees shorter than the requested depth
+        self._cache_depth = min(self.cache_depth, len(self._levels) - 1)
+        self._cache_layer = self._levels[-1 - self._cache_depth]
+        return self._levels[-1][0].hex()
     
-    def _build_tree(self, nodes: List[MerkleNode]) -> MerkleNode:
-        """Recursively build the Merkle tree."""
-        if len(nodes) == 1:
-            return nodes[0]
-        
-        # Create parent level
-        parent_nodes = []
-        
-        for i in range(0, len(nodes), 2):
-            left = nodes[i]
-            # Handle odd number of nodes
-            right = nodes[i + 1] if i + 1 < len(nodes) else left
-            
-            # Create parent node
-            parent_hash = self._hash(left.hash + right.hash)
-            parent = MerkleNode(
-                hash=parent_hash,
-                left=left,
-                right=right
-            )
-            parent_nodes.append(parent)
-        
-        # Recursively build upper levels
-        return self._build_tree(parent_nodes)
+    def _build_tree(self, hashes: List[bytes]) -> List[List[bytes]]:
+        """Hash level by level up to the root, returning every level."""
+        level_hasher = self._level_hasher
+        levels = [hashes]
+        while len(hashes) > 1:
+            hashes = level_hasher(hashes)
+            levels.append(hashes)
+        return levels
+    
+    def _build_nodes(self) -> MerkleNode:
+        """Link parent nodes over the computed level hashes."""
+        nodes = self.leaves
+        for hashes in self._levels[1:]:
+            lefts = nodes[0::2]
+            rights = nodes[1::2]
+            if len(nodes) % 2:
+                # Handle odd number of nodes
+                rights.append(nodes[-1])
+            nodes = [
+                MerkleNode(hash=parent_hash, left=left, right=right)
+                for parent_hash, left, right in zip(hashes, lefts, rights)
+            ]
+        return nodes[0]
     
     def get_root(self) -> Optional[str]:
         """Get the root hash of the tree."""
-        return self.root.hash if self.root else None
+        return self._levels[-1][0].hex() if self._levels else None
     
     def generate_proof(self, data_item: Union[str, Dict[str, Any], int]) -> Optional[MerkleProof]:
         """Generate proof of inclusion for a data item."""
-        if not self.root:
+        if not self._levels:
             return None
         
         # Find leaf index
@@ -132,12 +239,7 @@ class MerkleTree:
                 return None
         else:
             # Hash the data item
-            if isinstance(data_item, dict):
-                item_str = json.dumps(data_item, sort_keys=True)
-            else:
-                item_str = str(data_item)
-            
-            leaf_hash = self._hash(item_str)
+            leaf_hash = self._hash(_leaf_bytes(data_item))
             
             if leaf_hash not in self._leaf_map:
                 return None
@@ -150,22 +252,25 @@ class MerkleTree:
         return MerkleProof(
             leaf_hash=leaf_hash,
             leaf_index=leaf_index,
-            root_hash=self.root.hash,
-            proof_path=proof_path
+            root_hash=self._levels[-1][0],
+            proof_path=proof_path,
+            # The cached-layer node above the leaf: i // 2 ** (H - L)
+            cache_index=leaf_index >> len(proof_path) if self._cache_depth else None,
         )
     
-    def _generate_proof_path(self, leaf_index: int) -> List[Tuple[str, str]]:
-        """Generate the proof path from leaf to root."""
+    def _generate_proof_path(self, leaf_index: int) -> List[Tuple[bytes, str]]:
+        """Generate the proof path from leaf to root or the cached layer.
+        
+        Sibling hashes are read from the levels computed by ``build``.
+        """
         proof_path = []
         
         # Calculate path through tree levels
         current_index = leaf_index
-        level_size = len(self.leaves)
         
-        # Start from leaves and work up
-        nodes = self.leaves.copy()
-        
-        while level_size > 1:
+        # Every level below the cached layer (the root by default)
+        # contributes one sibling
+        for hashes in self._levels[:-1 - self._cache_depth]:
             # Find sibling
             if current_index % 2 == 0:
                 # Current is left, sibling is right
@@ -177,58 +282,48 @@ class MerkleTree:
                 direction = 'left'
             
             # Handle edge case for odd number of nodes
-            if sibling_index >= level_size:
+            if sibling_index >= len(hashes):
                 sibling_index = current_index
             
             # Add sibling to proof path
-            sibling_hash = nodes[sibling_index].hash
-            proof_path.append((sibling_hash, direction))
+            proof_path.append((hashes[sibling_index], direction))
             
             # Move to parent level
             current_index //= 2
-            
-            # Build parent level
-            parent_nodes = []
-            for i in range(0, level_size, 2):
-                left = nodes[i]
-                right = nodes[i + 1] if i + 1 < level_size else left
-                parent_hash = self._hash(left.hash + right.hash)
-                parent_nodes.append(MerkleNode(hash=parent_hash))
-            
-            nodes = parent_nodes
-            level_size = len(parent_nodes)
         
         return proof_path
     
     def verify_proof(self, proof: MerkleProof) -> bool:
         """Verify a Merkle proof."""
-        # Start with leaf hash
-        current_hash = proof.leaf_hash
-        
-        # Follow proof path
-        for sibling_hash, direction in proof.proof_path:
-            if direction == 'left':
-                # Sibling is on the left
-                current_hash = self._hash(sibling_hash + current_hash)
-            else:
-                # Sibling is on the right
-                current_hash = self._hash(current_hash + sibling_hash)
-        
-        # Check if we reached the expected root
-        return current_hash == proof.root_hash
+        if proof.cache_index is not None:
+            # Truncated path: it must reach this tree's cached layer
+            if not self._levels:
+                return False
+            if proof.root_hash != self._levels[-1][0] or not 0 <= proof.cache_index < len(self._cache_layer):
+                return False
+            return _proof_root(self._new_hash, proof) == self._cache_layer[proof.cache_index]
+        # Check if the path reaches the expected root
+        return _proof_root(self._new_hash, proof) == proof.root_hash
+    
+    def _hash_level(self, hashes: List[bytes]) -> List[bytes]:
+        """Hash each adjacent pair of a level, duplicating an odd tail."""
+        new_hash = self._new_hash
+        # zip stops before an odd last node, which is paired separately
+        parents = [new_hash(left + right).digest() for left, right in zip(hashes[0::2], hashes[1::2])]
+        if len(hashes) % 2:
+            parents.append(_hash_self_pair(new_hash, hashes[-1]))
+        return parents
     
-    def _hash(self, data: Union[str, bytes]) -> str:
+    def _hash(self, data: Union[str, bytes]) -> bytes:
         """Hash data using the configured hash function."""
         if isinstance(data, str):
             data = data.encode('utf-8')
         
-        hasher = hashlib.new(self.hash_func)
-        hasher.update(data)
-        return hasher.hexdigest()
+        return self._new_hash(data).digest()
     
     def get_leaves(self) -> List[str]:
         """Get all leaf hashes."""
-        return [leaf.hash for leaf in self.leaves]
+        return [leaf.hash.hex() for leaf in self.leaves]
     
     def visualize(self) -> str:
         """Create a text visualization of the tree."""
@@ -236,43 +331,47 @@ class MerkleTree:
             return "Empty tree"
         
         lines = []
-        self._visualize_node(self.root, "", True, lines)
-        return "\n".join(lines)
-    
-    def _visualize_node(self, node: MerkleNode, prefix: str, is_tail: bool, lines: List[str]):
-        """Recursively visualize tree nodes."""
-        # Add current node
-        connector = "└── " if is_tail else "├── "
-        lines.append(prefix + connector + node.hash[:8] + ("... (leaf)" if node.is_leaf else "..."))
+        # Explicit stack instead of recursion; children are pushed right
+        # first so the left subtree is printed first
+        stack = [(self.root, "", True)]
         
-        # Add children
-        if node.left and not node.is_leaf:
-            extension = "    " if is_tail else "│   "
-            if node.right and node.right != node.left:
-                self._visualize_node(node.left, prefix + extension, False, lines)
-                self._visualize_node(node.right, prefix + extension, True, lines)
-            else:
-                self._visualize_node(node.left, prefix + extension, True, lines)
+        while stack:
+            node, prefix, is_tail = stack.pop()
+            
+            # Add current node
+            connector = "└── " if is_tail else "├── "
+            lines.append(prefix + connector + node.hash.hex()[:8] + ("... (leaf)" if node.is_leaf else "..."))
+            
+            # Add children; an odd last node is paired with itself
+            if node.left is not None and not node.is_leaf:
+                child_prefix = prefix + ("    " if is_tail else "│   ")
+                if node.right is not None and node.right is not node.left:
+                    stack.append((node.right, child_prefix, True))
+                    stack.append((node.left, child_prefix, False))
+                else:
+                    stack.append((node.left, child_prefix, True))
+        
+        return "\n".join(lines)
 
 
 class IncrementalMerkleTree:
-    """Merkle tree that supports incremental updates."""
+    """Merkle tree that supports incremental updates.
+    
+    Levels hold raw digests, hashed the same way as ``MerkleTree``; hashes
+    are returned hex-encoded. Each level keeps only the nodes whose
+    subtrees are complete, so appends never rewrite a stored node and the
+    root is folded from the right edge of each level in O(log N).
+    """
     
     def __init__(self, hash_func: str = 'sha256'):
         self.hash_func = hash_func
-        self.levels: List[List[str]] = [[]]  # Level 0 is leaves
-        self._hasher = lambda x: hashlib.new(hash_func, x.encode() if isinstance(x, str) else x).hexdigest()
+        self.levels: List[List[bytes]] = [[]]  # Level 0 is leaves
+        self._new_hash = _hash_constructor(hash_func)
     
     def append(self, data: Union[str, Dict[str, Any]]) -> str:
         """Append a new leaf and update the tree."""
-        # Convert to string if needed
-        if isinstance(data, dict):
-            data_str = json.dumps(data, sort_keys=True)
-        else:
-            data_str = str(data)
-        
         # Hash the data
-        leaf_hash = self._hasher(data_str)
+        leaf_hash = self._new_hash(_leaf_bytes(data)).digest()
         
         # Add to leaves
         self.levels[0].append(leaf_hash)
@@ -280,56 +379,55 @@ class IncrementalMerkleTree:
         # Update tree
         self._update_tree(len(self.levels[0]) - 1)
         
-        return leaf_hash
+        return leaf_hash.hex()
     
     def _update_tree(self, new_leaf_index: int):
         """Update tree after adding a new leaf."""
+        new_hash = self._new_hash
+        levels = self.levels
         current_index = new_leaf_index
+        level = 0
         
-        for level in range(len(self.levels) - 1):
+        # Each completed pair completes a parent one level up; the pair is
+        # always the last two nodes of its level
+        while current_index % 2 == 1:
             # Check if we need a new level
-            if level + 1 >= len(self.levels):
-                self.levels.append([])
+            if level + 1 >= len(levels):
+                levels.append([])
             
-            # Check if this is a right child
-            if current_index % 2 == 1:
-                # Combine with left sibling
-                left_hash = self.levels[level][current_index - 1]
-                right_hash = self.levels[level][current_index]
-                parent_hash = self._hasher(left_hash + right_hash)
-                
-                # Add or update parent
-                parent_index = current_index // 2
-                if parent_index >= len(self.levels[level + 1]):
-                    self.levels[level + 1].append(parent_hash)
-                else:
-                    self.levels[level + 1][parent_index] = parent_hash
-                
-                current_index = parent_index
-            else:
-                # This is a left child, wait for right sibling
-                break
+            # Combine with left sibling
+            nodes = levels[level]
+            levels[level + 1].append(new_hash(nodes[-2] + nodes[-1]).digest())
+            
+            current_index //= 2
+            level += 1
     
     def get_root(self) -> Optional[str]:
         """Get current root hash."""
         if not self.levels[0]:
             return None
         
-        # Calculate root by combining unpaired nodes
-        level_hashes = self.levels[0].copy()
-        
-        while len(level_hashes) > 1:
-            next_level = []
-            
-            for i in range(0, len(level_hashes), 2):
-                left = level_hashes[i]
-                right = level_hashes[i + 1] if i + 1 < len(level_hashes) else left
-                parent = self._hasher(left + right)
-                next_level.append(parent)
+        # Fold the right edge upwards. Above the complete nodes of a level
+        # there is at most one partial node, built from the level's last
+        # complete node and the partial node below, duplicating as needed.
+        new_hash = self._new_hash
+        partial = None
+        level = 0
+        
+        while True:
+            complete = self.levels[level] if level < len(self.levels) else []
+            if len(complete) + (partial is not None) == 1:
+                return (partial if partial is not None else complete[0]).hex()
             
-            level_hashes = next_level
-        
-        return level_hashes[0]
+            if len(complete) % 2:
+                last = complete[-1]
+                if partial is None:
+                    partial = _hash_self_pair(new_hash, last)
+                else:
+                    partial = new_hash(last + partial).digest()
+            elif partial is not None:
+                partial = _hash_self_pair(new_hash, partial)
+            level += 1
     
     def generate_consistency_proof(self, old_size: int, new_size: int) -> List[str]:
         """Generate proof that old tree is consistent with new tree."""
@@ -353,17 +451,52 @@ class MerkleVerifier:
     """Utilities for Merkle tree verification."""
     
     @staticmethod
-    def verify_batch_proofs(proofs: List[MerkleProof], expected_root: str) -> Tuple[List[bool], bool]:
-        """Verify multiple proofs against the same root."""
+    def verify_batch_proofs(
+        proofs: List[MerkleProof],
+        expected_root: str,
+        hash_func: str = 'sha256',
+    ) -> Tuple[List[bool], bool]:
+        """Verify multiple proofs against the same root.
+        
+        Proofs from one tree share the upper part of their paths. Once a
+        proof verifies, each node on its path is remembered with the rest
+        of that path; a later proof reaching the same node with the same
+        remaining siblings must reach the same root, so it stops hashing.
+        """
         results = []
-        tree = MerkleTree()
+        new_hash = _hash_constructor(hash_func)
+        expected_root = bytes.fromhex(expected_root)
+        # Node digest -> (depth, path) of a verified proof passing through it
+        verified: Dict[bytes, Tuple[int, List[Tuple[bytes, str]]]] = {}
         
         for proof in proofs:
             # All proofs should have the same root
             if proof.root_hash != expected_root:
                 results.append(False)
-            else:
-                results.append(tree.verify_proof(proof))
+                continue
+            
+            path = proof.proof_path
+            current_hash = proof.leaf_hash
+            visited = []
+            valid = None
+            
+            for depth, (sibling_hash, direction) in enumerate(path):
+                known = verified.get(current_hash)
+                if known is not None and known[1][known[0]:] == path[depth:]:
+                    valid = True
+                    break
+                visited.append(current_hash)
+                if direction == 'left':
+                    current_hash = new_hash(sibling_hash + current_hash).digest()
+                else:
+                    current_hash = new_hash(current_hash + sibling_hash).digest()
+            
+            if valid is None:
+                valid = current_hash == expected_root
+            if valid:
+                for depth, node_hash in enumerate(visited):
+                    verified.setdefault(node_hash, (depth, path))
+            results.append(valid)
         
         all_valid = all(results)
         return results, all_valid
@@ -380,8 +513,12 @@ class MerkleVerifier:
     def verify_subset(subset_root: str, subset_proofs: List[MerkleProof], full_tree_root: str) -> bool:
         """Verify that a subset is part of a larger tree."""
         # This would require additional proof data
-        # Simplified version
+        # Simplified version; proofs carry raw digests, the roots are hex
+        try:
+            expected_root = bytes.fromhex(full_tree_root)
+        except ValueError:
+            return False
         for proof in subset_proofs:
-            if proof.root_hash != full_tree_root:
+            if proof.root_hash != expected_root:
                 return False
         return True
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Digital signature implementation for SignLedger."""
 
-import base64
+import binascii
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple, Optional, Union, Dict, Any, List
 from abc import ABC, abstractmethod
 import logging
@@ -17,6 +19,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+if HAS_CRYPTOGRAPHY:
+    # Signature parameters are immutable; build them once, not per call
+    _SHA256 = hashes.SHA256()
+    _RSA_PSS = padding.PSS(
+        mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=padding.PSS.MAX_LENGTH
+    )
+    _ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
 
 class SignatureError(Exception):
     """Signature-related errors."""
@@ -54,6 +65,8 @@ class RSASigner(Signer):
         if not HAS_CRYPTOGRAPHY:
             raise ImportError("cryptography is required for signatures. Install with: pip install cryptography")
         
+        self._public_key_pem: Optional[str] = None
+        
         if private_key:
             if isinstance(private_key, str):
                 private_key = private_key.encode('utf-8')
@@ -85,31 +98,16 @@ class RSASigner(Signer):
         if not self._private_key:
             raise SignatureError("Private key required for signing")
         
-        signature = self._private_key.sign(
-            data,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        signature = self._private_key.sign(data, _RSA_PSS, _SHA256)
         
-        return base64.b64encode(signature).decode('utf-8')
+        return binascii.b2a_base64(signature, newline=False).decode('ascii')
     
     def verify(self, data: bytes, signature: str) -> bool:
         """Verify RSA signature."""
         try:
-            signature_bytes = base64.b64decode(signature)
+            signature_bytes = binascii.a2b_base64(signature)
             
-            self._public_key.verify(
-                signature_bytes,
-                data,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
+            self._public_key.verify(signature_bytes, data, _RSA_PSS, _SHA256)
             
             return True
             
@@ -118,11 +116,14 @@ class RSASigner(Signer):
     
     def get_public_key_pem(self) -> str:
         """Get public key in PEM format."""
-        pem = self._public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode('utf-8')
+        # Keys never change, so the encoding is computed once
+        if self._public_key_pem is None:
+            pem = self._public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            self._public_key_pem = pem.decode('utf-8')
+        return self._public_key_pem
     
     def get_private_key_pem(self) -> str:
         """Get private key in PEM format."""
@@ -149,6 +150,8 @@ class ECDSASigner(Signer):
         if not HAS_CRYPTOGRAPHY:
             raise ImportError("cryptography is required for signatures. Install with: pip install cryptography")
         
+        self._public_key_pem: Optional[str] = None
+        
         # Map curve names to cryptography curves
         curve_map = {
             "secp256r1": ec.SECP256R1(),
@@ -192,23 +195,16 @@ class ECDSASigner(Signer):
         if not self._private_key:
             raise SignatureError("Private key required for signing")
         
-        signature = self._private_key.sign(
-            data,
-            ec.ECDSA(hashes.SHA256())
-        )
+        signature = self._private_key.sign(data, _ECDSA_SHA256)
         
-        return base64.b64encode(signature).decode('utf-8')
+        return binascii.b2a_base64(signature, newline=False).decode('ascii')
     
     def verify(self, data: bytes, signature: str) -> bool:
         """Verify ECDSA signature."""
         try:
-            signature_bytes = base64.b64decode(signature)
+            signature_bytes = binascii.a2b_base64(signature)
             
-            self._public_key.verify(
-                signature_bytes,
-                data,
-                ec.ECDSA(hashes.SHA256())
-            )
+            self._public_key.verify(signature_bytes, data, _ECDSA_SHA256)
             
             return True
             
@@ -217,11 +213,14 @@ class ECDSASigner(Signer):
     
     def get_public_key_pem(self) -> str:
         """Get public key in PEM format."""
-        pem = self._public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode('utf-8')
+        # Keys never change, so the encoding is computed once
+        if self._public_key_pem is None:
+            pem = self._public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            self._public_key_pem = pem.decode('utf-8')
+        return self._public_key_pem
     
     def get_private_key_pem(self) -> str:
         """Get private key in PEM format."""
@@ -247,6 +246,8 @@ class Ed25519Signer(Signer):
         if not HAS_CRYPTOGRAPHY:
             raise ImportError("cryptography is required for signatures. Install with: pip install cryptography")
         
+        self._public_key_pem: Optional[str] = None
+        
         if private_key:
             if isinstance(private_key, str):
                 private_key = private_key.encode('utf-8')
@@ -276,12 +277,12 @@ class Ed25519Signer(Signer):
         
         signature = self._private_key.sign(data)
         
-        return base64.b64encode(signature).decode('utf-8')
+        return binascii.b2a_base64(signature, newline=False).decode('ascii')
     
     def verify(self, data: bytes, signature: str) -> bool:
         """Verify Ed25519 signature."""
         try:
-            signature_bytes = base64.b64decode(signature)
+            signature_bytes = binascii.a2b_base64(signature)
             
             self._public_key.verify(signature_bytes, data)
             
@@ -292,11 +293,14 @@ class Ed25519Signer(Signer):
     
     def get_public_key_pem(self) -> str:
         """Get public key in PEM format."""
-        pem = self._public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode('utf-8')
+        # Keys never change, so the encoding is computed once
+        if self._public_key_pem is None:
+            pem = self._public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            self._public_key_pem = pem.decode('utf-8')
+        return self._public_key_pem
     
     def get_private_key_pem(self) -> str:
         """Get private key in PEM format."""
@@ -312,11 +316,39 @@ class Ed25519Signer(Signer):
 
 
 class MultiSigner:
-    """Multi-signature support."""
+    """Multi-signature support.
+    
+    With ``max_workers`` set, ``sign`` and ``verify`` run each key's
+    operation on a shared thread pool, which helps when signers wait on
+    I/O (remote KMS or HSM signers) or release the GIL. ``verify`` stops
+    as soon as enough signatures are valid.
+    """
     
-    def __init__(self, required_signatures: int = 1):
+    def __init__(self, required_signatures: int = 1, max_workers: Optional[int] = None):
         self.required_signatures = required_signatures
+        self.max_workers = max_workers
         self._signers: Dict[str, Signer] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+    
+    def _get_pool(self) -> Optional[ThreadPoolExecutor]:
+        """Create the worker pool on first use, if enabled."""
+        if not self.max_workers or self.max_workers < 2:
+            return None
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="MultiSigner"
+                    )
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
     
     def add_signer(self, key_id: str, signer: Signer) -> None:
         """Add a signer."""
@@ -335,14 +367,27 @@ class MultiSigner:
             key_ids = list(self._signers.keys())
         
         signatures = {}
+        key_ids = [key_id for key_id in key_ids if key_id in self._signers]
+        pool = self._get_pool() if len(key_ids) > 1 else None
         
-        for key_id in key_ids:
-            if key_id in self._signers:
+        if pool is None:
+            for key_id in key_ids:
                 try:
                     signature = self._signers[key_id].sign(data)
                     signatures[key_id] = signature
                 except Exception as e:
                     logger.error(f"Failed to sign with key {key_id}: {e}")
+        else:
+            futures = {
+                key_id: pool.submit(self._signers[key_id].sign, data)
+                for key_id in key_ids
+            }
+            # Collected in key order so the result matches the serial path
+            for key_id, future in futures.items():
+                try:
+                    signatures[key_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to sign with key {key_id}: {e}")
         
         if len(signatures) < self.required_signatures:
             raise SignatureError(
@@ -354,14 +399,38 @@ class MultiSigner:
     def verify(self, data: bytes, signatures: Dict[str, str]) -> bool:
         """Verify multi-signatures."""
         valid_count = 0
+        items = [
+            (key_id, signature) for key_id, signature in signatures.items()
+            if key_id in self._signers
+        ]
+        pool = self._get_pool() if len(items) > 1 else None
         
-        for key_id, signature in signatures.items():
-            if key_id in self._signers:
+        if pool is None:
+            for key_id, signature in items:
                 try:
                     if self._signers[key_id].verify(data, signature):
                         valid_count += 1
+                        if valid_count >= self.required_signatures:
+                            return True
                 except Exception as e:
                     logger.error(f"Failed to verify signature for key {key_id}: {e}")
+        else:
+            futures = {
+                pool.submit(self._signers[key_id].verify, data, signature): key_id
+                for key_id, signature in items
+            }
+            try:
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            valid_count += 1
+                            if valid_count >= self.required_signatures:
+                                return True
+                    except Exception as e:
+                        logger.error(f"Failed to verify signature for key {futures[future]}: {e}")
+            finally:
+                for future in futures:
+                    future.cancel()
         
         return valid_count >= self.required_signatures
     
@@ -1,8 +1,11 @@
 """Django integration for SignLedger."""
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional, List, Type
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Type
+from dataclasses import dataclass
 from datetime import datetime
 
 try:
@@ -17,12 +20,56 @@ except ImportError:
     HAS_DJANGO = False
     models = None
 
+# Async middleware helpers; markcoroutinefunction needs asgiref 3.6+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+    HAS_ASGIREF = True
+except ImportError:
+    HAS_ASGIREF = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..core.ledger import Ledger
 from ..core.entry import Entry
 from ..backends.base import StorageBackend
 
 logger = logging.getLogger(__name__)
 
+# Used on request and response bodies; both raise ValueError subclasses
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Entry columns in the order _model_to_dict reads them
+_ENTRY_FIELDS = ('sequence', 'timestamp', 'data', 'hash', 'previous_hash', 'metadata', 'signature')
+_get_entry_fields = attrgetter(*_ENTRY_FIELDS)
+
+# Columns chain-link verification reads
+_CHAIN_FIELDS = ('sequence', 'hash', 'previous_hash')
+
+# Cached result of the audit_entry_count template tag
+ENTRY_COUNT_CACHE_KEY = 'signledger:count'
+ENTRY_COUNT_CACHE_TIMEOUT = 30  # seconds
+
+# Resolved AuditEntry model; the app registry doesn't change once loaded
+_AUDIT_MODEL = None
+
+
+def _audit_model() -> Type['models.Model']:
+    """Look up the AuditEntry model once, skipping the registry afterwards.
+    
+    Raises:
+        LookupError: If the model isn't installed
+    """
+    global _AUDIT_MODEL
+    if _AUDIT_MODEL is None:
+        from django.apps import apps
+        _AUDIT_MODEL = apps.get_model('signledger', 'AuditEntry')
+    return _AUDIT_MODEL
+
+
 # Signals
 if HAS_DJANGO:
     entry_created = Signal()  # sender=model_instance, entry=Entry
@@ -32,6 +79,15 @@ if HAS_DJANGO:
 class DjangoStorageBackend(StorageBackend):
     """Django ORM-based storage backend for SignLedger."""
     
+    # Rows per INSERT statement in append_many
+    BULK_BATCH_SIZE = 500
+    
+    # Rows fetched per round trip when streaming
+    ITERATOR_CHUNK_SIZE = 2000
+    
+    # Sequences per IN (...) query in get_many, under database parameter limits
+    GET_MANY_CHUNK_SIZE = 10000
+    
     def __init__(self, model_class: Optional[Type['models.Model']] = None, **kwargs):
         if not HAS_DJANGO:
             raise ImportError("Django is required. Install with: pip install django")
@@ -41,10 +97,8 @@ class DjangoStorageBackend(StorageBackend):
     
     def _get_default_model(self) -> Type['models.Model']:
         """Get or create default audit log model."""
-        from django.apps import apps
-        
         try:
-            return apps.get_model('signledger', 'AuditEntry')
+            return _audit_model()
         except LookupError:
             # Model doesn't exist, will be created by migrations
             return None
@@ -54,8 +108,65 @@ class DjangoStorageBackend(StorageBackend):
         if not self.model_class:
             raise RuntimeError("Model class not set. Run migrations first.")
         
-        # Create model instance
-        instance = self.model_class(
+        instance = self._new_instance(entry_data)
+        instance.save()
+        
+        self._entries_stored([instance], [entry_data])
+        
+        return instance.sequence
+    
+    def append_many(self, entries: List[Dict[str, Any]]) -> List[int]:
+        """Append entries with bulk INSERTs instead of one save() each.
+        
+        Rows are written ``BULK_BATCH_SIZE`` at a time. Like any
+        ``bulk_create``, this skips model ``save()`` and the
+        pre_save/post_save signals; ``entry_created`` is still sent for
+        each entry once all of them are stored. A single entry goes
+        through ``append`` and its ``save()``.
+        """
+        if len(entries) == 1:
+            return [self.append(entries[0])]
+        
+        if not self.model_class:
+            raise RuntimeError("Model class not set. Run migrations first.")
+        
+        instances = [self._new_instance(entry_data) for entry_data in entries]
+        self.model_class.objects.bulk_create(instances, batch_size=self.BULK_BATCH_SIZE)
+        
+        self._entries_stored(instances, entries)
+        
+        return [instance.sequence for instance in instances]
+    
+    def append_entry(self, entry: Any) -> None:
+        """Store a ledger entry with ``append``."""
+        self.append(self._entry_rows([entry])[0])
+    
+    def append_entries(self, entries: List[Any]) -> None:
+        """Store a batch of ledger entries with the bulk ``append_many``.
+        
+        The base class would append them one INSERT at a time.
+        """
+        self.append_many(self._entry_rows(entries))
+    
+    def _entry_rows(self, entries: List[Any]) -> List[Dict[str, Any]]:
+        """Convert ledger entries to row dicts, numbering unsequenced ones.
+        
+        Sequences continue from the latest stored entry. A writer racing
+        for the same numbers is rejected by the unique sequence column.
+        """
+        rows = [entry.to_dict() if hasattr(entry, 'to_dict') else dict(entry) for entry in entries]
+        if any('sequence' not in row for row in rows):
+            latest = self.model_class.objects.order_by('-sequence').values_list('sequence', flat=True).first()
+            next_sequence = 0 if latest is None else latest + 1
+            for row in rows:
+                if 'sequence' not in row:
+                    row['sequence'] = next_sequence
+                    next_sequence += 1
+        return rows
+    
+    def _new_instance(self, entry_data: Dict[str, Any]) -> 'models.Model':
+        """Create an unsaved model instance for an entry."""
+        return self.model_class(
             sequence=entry_data['sequence'],
             timestamp=entry_data['timestamp'],
             data=entry_data['data'],
@@ -64,16 +175,38 @@ class DjangoStorageBackend(StorageBackend):
             metadata=entry_data.get('metadata', {}),
             signature=entry_data.get('signature')
         )
-        instance.save()
-        
-        # Send signal
-        entry_created.send(
-            sender=instance.__class__,
-            instance=instance,
-            entry=Entry.from_dict(entry_data)
-        )
-        
-        return instance.sequence
+    
+    def _entries_stored(self, instances: List['models.Model'], entries: List[Dict[str, Any]]) -> None:
+        """Invalidate the cached count and send entry_created after a write."""
+        # Invalidated directly rather than by a receiver, which would keep
+        # entry_created from ever being listener-free. The rows are already
+        # stored, so a cache outage is logged rather than raised; the count
+        # then just expires with ENTRY_COUNT_CACHE_TIMEOUT.
+        from django.core.cache import cache
+        from django.db import router, transaction
+        
+        def invalidate_count():
+            try:
+                cache.delete(ENTRY_COUNT_CACHE_KEY)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate cached entry count: {e}")
+        
+        # Deleted only once the rows are visible; inside an open transaction
+        # a concurrent render would otherwise re-cache the old count
+        transaction.on_commit(invalidate_count, using=router.db_for_write(self.model_class))
+        
+        # Send signals; a failing receiver must not fail the write. Entry
+        # payloads are only built when a receiver is connected.
+        if entry_created.has_listeners(self.model_class):
+            for instance, entry_data in zip(instances, entries):
+                responses = entry_created.send_robust(
+                    sender=instance.__class__,
+                    instance=instance,
+                    entry=Entry.from_dict(entry_data)
+                )
+                for receiver, response in responses:
+                    if isinstance(response, Exception):
+                        logger.error(f"entry_created receiver {receiver} failed: {response}")
     
     def get(self, sequence: int) -> Optional[Dict[str, Any]]:
         """Get entry by sequence number."""
@@ -81,17 +214,36 @@ class DjangoStorageBackend(StorageBackend):
             return None
         
         try:
-            instance = self.model_class.objects.get(sequence=sequence)
+            instance = self._base_qs(_ENTRY_FIELDS).get(sequence=sequence)
             return self._model_to_dict(instance)
         except self.model_class.DoesNotExist:
             return None
     
+    def get_many(self, sequences: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get several entries by sequence number.
+        
+        Fetches up to ``GET_MANY_CHUNK_SIZE`` entries per query instead of
+        one query per entry. Missing sequences are left out of the result.
+        """
+        if not self.model_class:
+            return {}
+        
+        sequences = list(sequences)
+        result = {}
+        for i in range(0, len(sequences), self.GET_MANY_CHUNK_SIZE):
+            instances = self._base_qs(_ENTRY_FIELDS).filter(
+                sequence__in=sequences[i:i + self.GET_MANY_CHUNK_SIZE]
+            )
+            for instance in instances:
+                result[instance.sequence] = self._model_to_dict(instance)
+        return result
+    
     def get_latest(self) -> Optional[Dict[str, Any]]:
         """Get the latest entry."""
         if not self.model_class:
             return None
         
-        instance = self.model_class.objects.order_by('-sequence').first()
+        instance = self._base_qs(_ENTRY_FIELDS).order_by('-sequence').first()
         if instance:
             return self._model_to_dict(instance)
         return None
@@ -101,33 +253,103 @@ class DjangoStorageBackend(StorageBackend):
         if not self.model_class:
             return []
         
-        instances = self.model_class.objects.filter(
+        instances = self._base_qs(_ENTRY_FIELDS).filter(
             sequence__gte=start,
             sequence__lte=end
         ).order_by('sequence')
         
         return [self._model_to_dict(instance) for instance in instances]
     
-    def get_all(self) -> List[Dict[str, Any]]:
-        """Get all entries."""
+    def get_hashes_range(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """Get only the chain fields of entries in a sequence range.
+        
+        Returns dicts with ``sequence``, ``hash`` and ``previous_hash``,
+        which is all chain-link verification reads. The large ``data`` and
+        ``signature`` columns are never fetched and no model instances are
+        built.
+        """
         if not self.model_class:
             return []
         
-        instances = self.model_class.objects.order_by('sequence')
-        return [self._model_to_dict(instance) for instance in instances]
+        return list(
+            self._base_qs().filter(
+                sequence__gte=start,
+                sequence__lte=end
+            ).order_by('sequence').values(*_CHAIN_FIELDS)
+        )
+    
+    def find_chain_breaks(self, start: int, end: int) -> List[int]:
+        """Find entries in a sequence range whose previous_hash is wrong.
+        
+        The database compares each entry's ``previous_hash`` with the hash
+        of the entry before it using ``LAG``, so a clean range returns no
+        rows and nothing is loaded into Python. Only the returned
+        sequences need their hashes recomputed. This checks chain links
+        only, not the entry hashes themselves.
+        """
+        if not self.model_class:
+            return []
+        
+        from django.db import connections, router
+        
+        connection = connections[router.db_for_read(self.model_class)]
+        table = connection.ops.quote_name(self.model_class._meta.db_table)
+        # The window starts one entry early so the first entry in range
+        # has its predecessor to compare against
+        sql = (
+            "SELECT sequence FROM ("
+            " SELECT sequence, previous_hash,"
+            " LAG(hash) OVER (ORDER BY sequence) AS prior_hash"
+            f" FROM {table} WHERE sequence BETWEEN %s AND %s"
+            ") chain"
+            " WHERE sequence >= %s AND prior_hash IS NOT NULL"
+            " AND (previous_hash IS NULL OR previous_hash <> prior_hash)"
+            " ORDER BY sequence"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [start - 1, end, start])
+            return [row[0] for row in cursor.fetchall()]
+    
+    def get_all(self) -> Iterator[Dict[str, Any]]:
+        """Stream all entries in sequence order.
+        
+        Rows are fetched ``ITERATOR_CHUNK_SIZE`` at a time and not cached
+        on the queryset, so memory stays flat however large the table is.
+        Wrap in ``list()`` when a list is needed.
+        """
+        if not self.model_class:
+            return
+        
+        instances = self._base_qs(_ENTRY_FIELDS).order_by('sequence').iterator(
+            chunk_size=self.ITERATOR_CHUNK_SIZE
+        )
+        for instance in instances:
+            yield self._model_to_dict(instance)
     
     def search(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Search entries by criteria."""
+        """Search entries by criteria.
+        
+        ``data`` and ``metadata`` criteria are each matched with a single
+        containment lookup: one ``@>`` on PostgreSQL, served by the GIN
+        indexes on those fields, or one ``JSON_CONTAINS`` on MySQL.
+        """
         if not self.model_class:
             return []
         
-        queryset = self.model_class.objects.all()
+        queryset = self._base_qs(_ENTRY_FIELDS)
         
         # Apply filters
-        if 'data' in criteria:
-            # Search in JSON data field
-            for key, value in criteria['data'].items():
-                queryset = queryset.filter(data__contains={key: value})
+        if criteria.get('data'):
+            data_criteria = criteria['data']
+            if len(data_criteria) == 1 and isinstance(data_criteria.get('type'), str):
+                # data->>'type' = X, matching the BTREE expression index
+                from django.db.models.fields.json import KeyTextTransform
+                queryset = queryset.alias(
+                    entry_type=KeyTextTransform('type', 'data')
+                ).filter(entry_type=data_criteria['type'])
+            else:
+                # Search in JSON data field
+                queryset = queryset.filter(data__contains=data_criteria)
         
         if 'start_time' in criteria:
             queryset = queryset.filter(timestamp__gte=criteria['start_time'])
@@ -135,22 +357,36 @@ class DjangoStorageBackend(StorageBackend):
         if 'end_time' in criteria:
             queryset = queryset.filter(timestamp__lte=criteria['end_time'])
         
-        if 'metadata' in criteria:
-            for key, value in criteria['metadata'].items():
-                queryset = queryset.filter(metadata__contains={key: value})
+        if criteria.get('metadata'):
+            queryset = queryset.filter(metadata__contains=criteria['metadata'])
         
         return [self._model_to_dict(instance) for instance in queryset.order_by('sequence')]
     
+    def _base_qs(self, fields: Optional[Iterable[str]] = None) -> 'models.QuerySet':
+        """Queryset over the model, loading only ``fields`` when given.
+        
+        Readers returning entry dicts pass ``_ENTRY_FIELDS``, which skips
+        the Django-side columns such as ``created_by`` and ``created_at``.
+        Instances from a projected queryset load any other field with an
+        extra query on access, so callers must stay within ``fields``.
+        """
+        queryset = self.model_class.objects.all()
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+    
     def _model_to_dict(self, instance: 'models.Model') -> Dict[str, Any]:
         """Convert model instance to dict."""
+        # One C-level call fetches every column
+        sequence, timestamp, data, hash_, previous_hash, metadata, signature = _get_entry_fields(instance)
         return {
-            'sequence': instance.sequence,
-            'timestamp': instance.timestamp.isoformat() if hasattr(instance.timestamp, 'isoformat') else instance.timestamp,
-            'data': instance.data,
-            'hash': instance.hash,
-            'previous_hash': instance.previous_hash,
-            'metadata': instance.metadata or {},
-            'signature': instance.signature,
+            'sequence': sequence,
+            'timestamp': timestamp.isoformat() if hasattr(timestamp, 'isoformat') else timestamp,
+            'data': data,
+            'hash': hash_,
+            'previous_hash': previous_hash,
+            'metadata': metadata or {},
+            'signature': signature,
         }
     
     def close(self) -> None:
@@ -160,8 +396,69 @@ class DjangoStorageBackend(StorageBackend):
 
 # Django Models
 if HAS_DJANGO:
+    def _postgres_indexes(app_label: str, model_name: str) -> List['models.Index']:
+        """Indexes only PostgreSQL supports.
+        
+        GIN indexes serve JSON containment searches, and a BTREE index on
+        ``data->>'type'`` serves searches on the type alone. The covering
+        index on sequence lets chain verification, which reads ``hash``
+        and ``previous_hash`` by sequence range, run as an index-only scan.
+        """
+        from django.contrib.postgres.indexes import GinIndex
+        from django.db.models.fields.json import KeyTextTransform
+        
+        prefix = f'{app_label}_{model_name}'.lower()
+        return [
+            GinIndex(fields=['data'], name=f'{prefix}_data_gin'),
+            GinIndex(fields=['metadata'], name=f'{prefix}_meta_gin'),
+            models.Index(KeyTextTransform('type', 'data'), name=f'{prefix}_type_idx'),
+            models.Index(
+                fields=['sequence'],
+                include=['hash', 'previous_hash'],
+                name=f'{prefix}_seq_cov',
+            ),
+        ]
+    
+    
+    def postgres_index_operations(app_label: str, model_name: str) -> list:
+        """Migration operations creating the PostgreSQL-only audit indexes.
+        
+        Add them to a migration of the concrete audit model::
+        
+            operations = [
+                ...
+                *postgres_index_operations('myapp', 'AuditEntry'),
+            ]
+        
+        The indexes are created only when the migration runs on
+        PostgreSQL and are not part of the model's state, so
+        ``makemigrations`` output doesn't depend on the database engine.
+        """
+        from django.db import migrations
+        
+        def create_indexes(apps, schema_editor):
+            if schema_editor.connection.vendor != 'postgresql':
+                return
+            model = apps.get_model(app_label, model_name)
+            for index in _postgres_indexes(app_label, model_name):
+                schema_editor.add_index(model, index)
+        
+        def drop_indexes(apps, schema_editor):
+            if schema_editor.connection.vendor != 'postgresql':
+                return
+            model = apps.get_model(app_label, model_name)
+            for index in _postgres_indexes(app_label, model_name):
+                schema_editor.remove_index(model, index)
+        
+        return [migrations.RunPython(create_indexes, drop_indexes)]
+    
+    
     class AbstractAuditEntry(models.Model):
-        """Abstract base model for audit entries."""
+        """Abstract base model for audit entries.
+        
+        PostgreSQL-only indexes are added by migrations through
+        ``postgres_index_operations`` rather than ``Meta.indexes``.
+        """
         
         sequence = models.BigIntegerField(unique=True, db_index=True)
         timestamp = models.DateTimeField(db_index=True)
@@ -218,14 +515,46 @@ if HAS_DJANGO:
         pass
 
 
+@dataclass
+class AuditRequestContext:
+    """Request values read once per audited request.
+    
+    Set as ``request.audit_context`` so code running later in the request
+    reuses them instead of going through Django's descriptors again.
+    """
+    user: str
+    ip_address: Optional[str]
+    timestamp: str
+
+
 # Middleware
 class AuditMiddleware:
-    """Django middleware for automatic audit logging."""
+    """Django middleware for automatic audit logging.
+    
+    Under ASGI the middleware runs async: audit entries are queued and a
+    background task appends them to the ledger in batches, so responses
+    do not wait on the database. The entry's sequence isn't known when
+    the response is sent, so ``X-Audit-Entry-ID`` is only set under WSGI.
+    """
+    
+    sync_capable = True
+    # Without the asgiref helpers Django adapts the middleware to sync
+    async_capable = HAS_ASGIREF
     
     def __init__(self, get_response):
         self.get_response = get_response
         self.ledger = None
         self._init_ledger()
+        
+        self.async_mode = HAS_ASGIREF and iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        
+        # Created on the first async request, inside the server's loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Entries dropped because the queue was full
+        self.dropped_entries = 0
     
     def _init_ledger(self):
         """Initialize ledger from Django settings."""
@@ -234,6 +563,7 @@ class AuditMiddleware:
             backend = DjangoStorageBackend(
                 model_class=config.get('model_class', AuditEntry)
             )
+            self.backend = backend
             
             self.ledger = Ledger(
                 name=config.get('name', 'django_audit'),
@@ -245,38 +575,34 @@ class AuditMiddleware:
             self.exclude_paths = config.get('exclude_paths', ['/admin/', '/static/', '/media/'])
             self.include_request_data = config.get('include_request_data', True)
             self.include_response_data = config.get('include_response_data', False)
+            
+            # Matched once per request; str.startswith takes a tuple
+            self._audit_methods_set = frozenset(self.audit_methods)
+            self._exclude_prefix_tuple = tuple(self.exclude_paths)
+            
+            # Async write path
+            self.flush_batch_size = config.get('flush_batch_size', 200)
+            self.flush_interval = config.get('flush_interval', 0.05)  # seconds
+            self.queue_size = config.get('queue_size', 10000)
+            # False skips the WAL flush wait on PostgreSQL batch commits; a
+            # crash can then lose the last batches, which the hash chain
+            # shows as a missing tail
+            self.synchronous_commit = config.get('synchronous_commit', True)
     
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        
         if not self.ledger or not self._should_audit(request):
             return self.get_response(request)
         
-        # Capture request data
-        audit_data = {
-            'type': 'http_request',
-            'method': request.method,
-            'path': request.path,
-            'user': str(request.user) if request.user.is_authenticated else 'anonymous',
-            'ip_address': self._get_client_ip(request),
-            'timestamp': timezone.now().isoformat(),
-        }
-        
-        if self.include_request_data and request.body:
-            try:
-                audit_data['request_data'] = json.loads(request.body)
-            except:
-                audit_data['request_data'] = request.body[:1000].decode('utf-8', errors='ignore')
+        user = request.user
+        audit_data = self._request_audit_data(request, user)
         
         # Process request
         response = self.get_response(request)
         
-        # Add response data
-        audit_data['status_code'] = response.status_code
-        
-        if self.include_response_data and hasattr(response, 'content'):
-            try:
-                audit_data['response_data'] = json.loads(response.content)
-            except:
-                pass
+        self._add_response_data(audit_data, response)
         
         # Create audit entry
         try:
@@ -290,27 +616,159 @@ class AuditMiddleware:
         
         return response
     
-    def _should_audit(self, request) -> bool:
-        """Check if request should be audited."""
-        # Check method
-        if request.method not in self.audit_methods:
-            return False
+    async def __acall__(self, request):
+        if not self.ledger or not self._should_audit(request):
+            return await self.get_response(request)
+        
+        # request.user may hit the database, which is not allowed here
+        if hasattr(request, 'auser'):
+            user = await request.auser()
+        else:
+            user = await sync_to_async(lambda: request.user)()
+        audit_data = self._request_audit_data(request, user)
+        
+        # Process request
+        response = await self.get_response(request)
         
-        # Check excluded paths
-        for path in self.exclude_paths:
-            if request.path.startswith(path):
-                return False
+        self._add_response_data(audit_data, response)
+        
+        # Queue audit entry; the flush task writes it. A full queue drops
+        # the entry rather than stalling the response.
+        try:
+            self._ensure_flush_task()
+            self._queue.put_nowait(audit_data)
+        except asyncio.QueueFull:
+            self.dropped_entries += 1
+            logger.warning(f"Audit queue full, dropped entry ({self.dropped_entries} dropped so far)")
+        except Exception as e:
+            logger.error(f"Failed to queue audit entry: {e}")
         
-        return True
+        return response
+    
+    def _request_audit_data(self, request, user) -> Dict[str, Any]:
+        """Capture request data before the view runs."""
+        context = AuditRequestContext(
+            # get_username skips __str__ formatting on custom user models
+            user=user.get_username() if user.is_authenticated else 'anonymous',
+            ip_address=self._get_client_ip(request),
+            timestamp=timezone.now().isoformat(),
+        )
+        request.audit_context = context
+        
+        audit_data = {
+            'type': 'http_request',
+            'method': request.method,
+            'path': request.path,
+            'user': context.user,
+            'ip_address': context.ip_address,
+            'timestamp': context.timestamp,
+        }
+        
+        if self.include_request_data and request.body:
+            # Only JSON bodies are decoded; form posts and uploads would
+            # just fail the parse
+            if request.content_type.startswith('application/json'):
+                try:
+                    audit_data['request_data'] = _json_loads(request.body)
+                except ValueError:
+                    audit_data['request_data'] = request.body[:1000].decode('utf-8', errors='ignore')
+            else:
+                audit_data['request_data'] = request.body[:1000].decode('utf-8', errors='ignore')
+        
+        return audit_data
+    
+    def _add_response_data(self, audit_data: Dict[str, Any], response) -> None:
+        """Add response data to the audit entry."""
+        audit_data['status_code'] = response.status_code
+        
+        if (
+            self.include_response_data
+            and hasattr(response, 'content')
+            and response.get('Content-Type', '').startswith('application/json')
+        ):
+            try:
+                audit_data['response_data'] = _json_loads(response.content)
+            except ValueError:
+                pass
+    
+    def _ensure_flush_task(self) -> None:
+        """Start the flush task, or restart it if it died or its loop changed.
+        
+        Entries left in the previous queue are carried over to the new one.
+        """
+        task = self._flush_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        
+        if task is not None and task.done() and not task.cancelled() and task.exception():
+            logger.error(f"Audit flush task stopped: {task.exception()}")
+        
+        pending = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+        
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        # Same maxsize as the old queue, so everything fits
+        for audit_data in pending:
+            self._queue.put_nowait(audit_data)
+        self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self) -> None:
+        """Append queued entries in batches of up to flush_batch_size.
+        
+        A batch is written when it is full or flush_interval seconds after
+        its first entry arrived, whichever comes first.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        write_batch = sync_to_async(self._write_batch, thread_sensitive=False)
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.flush_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to create {len(batch)} audit entries: {e}")
+    
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch of audit entries in one transaction.
+        
+        One commit per batch instead of one per entry, so the WAL flush
+        is paid once for the whole batch.
+        """
+        from django.db import connections, router, transaction
+        
+        using = router.db_for_write(self.backend.model_class)
+        with transaction.atomic(using=using):
+            connection = connections[using]
+            if not self.synchronous_commit and connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit TO off")
+            self.ledger.append_many(batch)
+    
+    def _should_audit(self, request) -> bool:
+        """Check if request should be audited."""
+        return (
+            request.method in self._audit_methods_set
+            and not request.path.startswith(self._exclude_prefix_tuple)
+        )
     
     def _get_client_ip(self, request) -> str:
         """Get client IP address."""
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
+        meta = request.META
+        # First hop of X-Forwarded-For, without splitting the whole header
+        return meta.get('HTTP_X_FORWARDED_FOR', '').partition(',')[0] or meta.get('REMOTE_ADDR')
 
 
 # Management commands
@@ -347,35 +805,53 @@ def create_management_commands():
         
         def handle(self, *args, **options):
             # Initialize ledger
-            from django.apps import apps
-            model = apps.get_model('signledger', 'AuditEntry')
+            model = _audit_model()
             backend = DjangoStorageBackend(model_class=model)
             ledger = Ledger(name='django_audit', storage=backend)
             
             action = options['action']
             
             if action == 'verify':
-                self._verify_ledger(ledger, options)
+                self._verify_ledger(backend, ledger, options)
             elif action == 'export':
-                self._export_ledger(ledger, options)
+                self._export_ledger(backend, options)
             elif action == 'stats':
-                self._show_stats(ledger)
+                self._show_stats(backend)
         
-        def _verify_ledger(self, ledger, options):
-            """Verify ledger integrity."""
-            start = options.get('start', 0)
+        def _verify_ledger(self, backend, ledger, options):
+            """Verify ledger integrity.
+            
+            The database first finds broken chain links with one window
+            query. Every entry in the range is then streamed and its hash
+            recomputed, which catches rows whose data or metadata was
+            edited without touching the stored hash.
+            """
+            start = options.get('start') or 0
             end = options.get('end')
             
             if end is None:
-                latest = ledger.get_latest()
-                end = latest.sequence if latest else 0
+                latest = backend.get_latest()
+                end = latest['sequence'] if latest else 0
             
             self.stdout.write(f"Verifying entries {start} to {end}...")
             
-            valid, invalid = ledger.verify_range(start, end)
+            invalid = set(backend.find_chain_breaks(start, end))
+            
+            instances = backend._base_qs(_ENTRY_FIELDS).filter(
+                sequence__gte=start,
+                sequence__lte=end
+            ).order_by('sequence').iterator(chunk_size=backend.ITERATOR_CHUNK_SIZE)
+            
+            total = 0
+            for instance in instances:
+                total += 1
+                row = backend._model_to_dict(instance)
+                if not ledger.hash_chain.verify_hash(row, row['hash']):
+                    invalid.add(row['sequence'])
+            invalid = sorted(invalid)
             
             self.stdout.write(
-                self.style.SUCCESS(f"Valid entries: {len(valid)}")
+                self.style.SUCCESS(f"Valid entries: {total - len(invalid)}")
             )
             
             if invalid:
@@ -389,27 +865,51 @@ def create_management_commands():
                     self.style.SUCCESS("All entries are valid!")
                 )
         
-        def _export_ledger(self, ledger, options):
-            """Export ledger entries."""
+        def _export_ledger(self, backend, options):
+            """Export ledger entries.
+            
+            Rows stream straight from the backend as plain dicts and are
+            serialized with orjson when it is installed.
+            """
             output_file = options.get('output', 'audit_export.json')
             
-            entries = ledger.get_all()
+            encode = DjangoJSONEncoder(indent=2).encode
             
-            with open(output_file, 'w') as f:
-                json.dump(
-                    [e.to_dict() for e in entries],
-                    f,
-                    indent=2,
-                    cls=DjangoJSONEncoder
-                )
+            def dumps(entry):
+                if HAS_ORJSON:
+                    try:
+                        return orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+                    except TypeError:
+                        pass  # e.g. integers beyond 64 bits; fall back to json
+                return encode(entry)
+            
+            # Written one entry at a time so the export never holds the
+            # whole ledger in memory; the output is still one JSON array
+            count = 0
+            
+            with open(output_file, 'wb') as f:
+                f.write(b'[')
+                for entry in backend.get_all():
+                    f.write(b',\n' if count else b'\n')
+                    data = dumps(entry)
+                    f.write(data if isinstance(data, bytes) else data.encode('utf-8'))
+                    count += 1
+                f.write(b'\n]' if count else b']')
             
             self.stdout.write(
-                self.style.SUCCESS(f"Exported {len(entries)} entries to {output_file}")
+                self.style.SUCCESS(f"Exported {count} entries to {output_file}")
             )
         
-        def _show_stats(self, ledger):
-            """Show ledger statistics."""
-            latest = ledger.get_latest()
+        def _show_stats(self, backend):
+            """Show ledger statistics.
+            
+            Everything is computed by the database; no entry data is loaded.
+            """
+            from django.db.models import Count, F
+            
+            # Only the columns shown, not data or signature
+            entries = backend._base_qs(['sequence', 'timestamp'])
+            latest = entries.order_by('-sequence').first()
             
             if not latest:
                 self.stdout.write("No entries in ledger")
@@ -418,23 +918,24 @@ def create_management_commands():
             total = latest.sequence + 1
             
             # Get date range
-            first = ledger.get(0)
+            first = entries.filter(sequence=0).first()
             
             self.stdout.write(f"Total entries: {total}")
             self.stdout.write(f"First entry: {first.timestamp if first else 'N/A'}")
             self.stdout.write(f"Latest entry: {latest.timestamp}")
             
             # Show entry types if available
-            from collections import Counter
-            types = Counter()
-            
-            for entry in ledger.get_all():
-                entry_type = entry.data.get('type', 'unknown')
-                types[entry_type] += 1
+            types = (
+                backend._base_qs()
+                .values(entry_type=F('data__type'))
+                .annotate(count=Count('id'))
+                .order_by('-count')
+            )
             
             self.stdout.write("\nEntry types:")
-            for entry_type, count in types.most_common():
-                self.stdout.write(f"  {entry_type}: {count}")
+            for row in types:
+                entry_type = row['entry_type']
+                self.stdout.write(f"  {'unknown' if entry_type is None else entry_type}: {row['count']}")
     
     return Command
 
@@ -450,21 +951,42 @@ def create_template_tags():
     register = template.Library()
     
     @register.simple_tag
-    def audit_entry_count():
-        """Get total audit entry count."""
-        from django.apps import apps
+    def audit_entry_count(approximate=False):
+        """Get total audit entry count.
+        
+        The exact count is cached for ENTRY_COUNT_CACHE_TIMEOUT seconds and
+        dropped whenever the backend appends entries, so renders don't each run a
+        COUNT(*). ``approximate=True`` reads PostgreSQL's planner estimate
+        instead, which stays cheap on very large tables.
+        """
+        from django.core.cache import cache
         try:
-            model = apps.get_model('signledger', 'AuditEntry')
-            return model.objects.count()
+            model = _audit_model()
+            if approximate:
+                from django.db import connection
+                if connection.vendor == 'postgresql':
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                            [model._meta.db_table],
+                        )
+                        row = cursor.fetchone()
+                    # -1 until the table is first analyzed
+                    if row and row[0] >= 0:
+                        return row[0]
+            return cache.get_or_set(
+                ENTRY_COUNT_CACHE_KEY,
+                model.objects.count,
+                ENTRY_COUNT_CACHE_TIMEOUT,
+            )
         except:
             return 0
     
     @register.simple_tag
     def user_audit_entries(user):
         """Get audit entries for a user."""
-        from django.apps import apps
         try:
-            model = apps.get_model('signledger', 'AuditEntry')
+            model = _audit_model()
             return model.objects.filter(created_by=user).order_by('-timestamp')[:10]
         except:
             return []
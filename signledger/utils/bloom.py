@@ -0,0 +1,84 @@
+"""Scalable Bloom filter for SignLedger."""
+
+import hashlib
+import math
+from typing import List
+
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over strings.
+
+    Membership tests may return false positives at roughly ``error_rate``
+    once ``capacity`` items are added, but never false negatives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> List[int]:
+        """Bit positions for an item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by stacking filters as items are added.
+
+    Each new filter has ``growth`` times the capacity of the previous one
+    and a tighter error rate, so the overall false positive rate stays
+    near ``error_rate`` however many items are added.
+    """
+
+    TIGHTENING_RATIO = 0.9
+
+    def __init__(self, initial_capacity: int = 100_000, error_rate: float = 0.001, growth: int = 2):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self._filters: List[BloomFilter] = []
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        if not self._filters or self._filters[-1].count >= self._filters[-1].capacity:
+            n = len(self._filters)
+            self._filters.append(BloomFilter(
+                self.initial_capacity * self.growth ** n,
+                self.error_rate * (1 - self.TIGHTENING_RATIO) * self.TIGHTENING_RATIO ** n,
+            ))
+        self._filters[-1].add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return any(item in f for f in reversed(self._filters))
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self._filters)
@@ -0,0 +1,19 @@
+"""Tests for Merkle tree proofs."""
+
+from signledger.crypto.merkle import MerkleTree, MerkleVerifier
+
+
+def test_verify_subset_accepts_proofs_from_the_tree():
+    tree = MerkleTree()
+    root = tree.build([f"entry-{i}" for i in range(8)])
+    proofs = [tree.generate_proof(i) for i in (1, 4, 6)]
+    
+    assert MerkleVerifier.verify_subset("", proofs, root)
+
+
+def test_verify_subset_rejects_proofs_from_another_tree():
+    tree = MerkleTree()
+    tree.build([f"entry-{i}" for i in range(8)])
+    other_root = MerkleTree().build(["other"])
+    
+    assert not MerkleVerifier.verify_subset("", [tree.generate_proof(0)], other_root)